@@ -1,29 +1,515 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+XML parts are pretty-printed with a streaming (SAX) formatter that produces the
+same bytes as minidom's toprettyxml(indent="  ", encoding="ascii") while only
+holding the current element path in memory. Parts are formatted in parallel
+across a process pool.
+
+Only some parts can be unpacked (--parts), or none at all (--lazy). Such a
+partial tree records its source archive in a manifest file; parts that are not
+on disk are read from the archive on demand (see PackageView), and pack.py and
+the validators take them from there as well.
+
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py <office_file> <output_dir> --stream --jobs 4
+    python unpack.py <office_file> <output_dir> --parts word/document.xml "word/comments*.xml"
+    python unpack.py <office_file> <output_dir> --lazy
+"""
+
+import argparse
+import fnmatch
+import io
+import json
+import os
 import random
-import sys
-import defusedxml.minidom
+import shutil
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.sax.handler import ContentHandler, property_lexical_handler
+
+import defusedxml.sax
+
+INDENT = "  "
+NEWLINE = "\n"
+ENCODING = "ascii"
+
+# Parts smaller than this are not worth sending to a worker process on their own
+MIN_PARALLEL_BYTES = 256 * 1024
+
+# Marks a partially unpacked tree; read by pack.py and the validators
+PACKAGE_MANIFEST = ".ooxml-package.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Pretty-print XML parts straight from the archive instead of "
+        "extracting them first",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--parts",
+        nargs="+",
+        metavar="GLOB",
+        help="Only unpack parts named by, or matching, these globs (e.g. "
+        "'word/comments*.xml' or '[Content_Types].xml'); the rest stay in the "
+        "original file",
+    )
+    group.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Unpack nothing up front; parts are read from the original file "
+        "when first needed",
+    )
+    args = parser.parse_args()
+
+    unpack_document(
+        args.office_file,
+        args.output_dir,
+        stream=args.stream,
+        jobs=args.jobs,
+        parts=args.parts,
+        lazy=args.lazy,
+    )
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(
+    input_file, output_dir, stream=False, jobs=None, parts=None, lazy=False
+):
+    """Unpack an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to unpack into (created if needed)
+        stream: If True, XML parts are formatted while reading them from the
+            archive; otherwise everything is extracted first and formatted in place
+        jobs: Number of worker processes (default: number of CPUs)
+        parts: Optional list of globs; only matching parts are unpacked
+        lazy: If True, nothing is unpacked up front
+
+    Returns:
+        PackageView: View of the unpacked tree
+    """
+    input_file = Path(input_file)
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if parts is not None or lazy:
+        view = PackageView.create(input_file, output_path)
+        if parts:
+            selected = [name for name in view.archive_names() if _matches(name, parts)]
+            tasks = [
+                (str(input_file), name, view.archive_info(name).file_size)
+                for name in selected
+                if _is_xml(name)
+            ]
+            for name in selected:
+                if not _is_xml(name):
+                    view.path(name)
+            _run_tasks(tasks, output_path, jobs)
+        return view
+
+    with zipfile.ZipFile(input_file) as zf:
+        members = [info for info in zf.infolist() if not info.is_dir()]
+        if stream:
+            xml_members = [info for info in members if _is_xml(info.filename)]
+            for info in members:
+                if not _is_xml(info.filename):
+                    zf.extract(info, output_path)
+        else:
+            zf.extractall(output_path)
+            xml_members = []
+
+    if stream:
+        tasks = [
+            (str(input_file), info.filename, info.file_size) for info in xml_members
+        ]
+    else:
+        xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
+        tasks = [(None, str(path), path.stat().st_size) for path in xml_files]
+
+    _run_tasks(tasks, output_path, jobs)
+    return PackageView(output_path)
+
+
+class PackageView:
+    """
+    An unpacked Office package whose parts may still live in the original file.
+
+    Parts on disk take precedence. Parts that were not unpacked are read from
+    the source archive recorded in the tree's manifest: read_bytes() and open()
+    read them in place (media is never extracted), while path() materializes a
+    part on first access (pretty-printing XML) so it can be edited. A plain,
+    fully unpacked directory works too; it simply has no archive behind it.
+
+    Example:
+        view = unpack_document("deck.pptx", "unpacked", lazy=True)
+        slide = view.path("ppt/slides/slide3.xml")  # unpacked now
+        image = view.read_bytes("ppt/media/image1.png")  # read from the zip
+        view.remove("ppt/slides/slide9.xml")
+    """
+
+    def __init__(self, root):
+        """
+        Open the tree at root.
+
+        Args:
+            root: Unpacked directory (with or without a manifest)
+        """
+        self.root = Path(root)
+        self.source = None
+        self.removed = set()
+        manifest = self.root / PACKAGE_MANIFEST
+        if manifest.exists():
+            data = json.loads(manifest.read_text(encoding="utf-8"))
+            self.source = Path(data["source"])
+            self.removed = set(data.get("removed", []))
+        self._archive = None
+
+    @classmethod
+    def create(cls, source, root):
+        """Start a partial tree at root backed by the archive source."""
+        Path(root).mkdir(parents=True, exist_ok=True)
+        view = cls(root)
+        view.source = Path(source).resolve()
+        view.removed = set()
+        view._write_manifest()
+        return view
+
+    @property
+    def is_partial(self):
+        """True if some parts may only exist in the source archive."""
+        return self.source is not None
+
+    def archive_names(self):
+        """Names of the parts in the source archive (empty if there is none)."""
+        if self.source is None:
+            return []
+        return [info.filename for info in self.archive.infolist() if not info.is_dir()]
+
+    def archive_info(self, name):
+        """zipfile.ZipInfo for a part in the source archive."""
+        return self.archive.getinfo(name)
+
+    @property
+    def archive(self):
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self.source)
+        return self._archive
+
+    def names(self):
+        """All part names of the package, unpacked or not, sorted."""
+        names = {
+            path.relative_to(self.root).as_posix()
+            for path in self.root.rglob("*")
+            if path.is_file() and path.name != PACKAGE_MANIFEST
+        }
+        names.update(n for n in self.archive_names() if n not in self.removed)
+        return sorted(names)
+
+    def __contains__(self, name):
+        if (self.root / name).is_file():
+            return True
+        return (
+            self.source is not None
+            and name not in self.removed
+            and name in self.archive.NameToInfo
+        )
+
+    def is_unpacked(self, name):
+        """True if the part is on disk."""
+        return (self.root / name).is_file()
+
+    def read_bytes(self, name):
+        """Return the bytes of a part without unpacking it."""
+        path = self.root / name
+        if path.is_file():
+            return path.read_bytes()
+        self._check_in_archive(name)
+        return self.archive.read(name)
+
+    def open(self, name):
+        """Open a part for binary reading without unpacking it."""
+        path = self.root / name
+        if path.is_file():
+            return open(path, "rb")
+        self._check_in_archive(name)
+        return self.archive.open(name)
+
+    def path(self, name):
+        """
+        Return the on-disk path of a part, unpacking it first if needed.
+
+        For names that are not in the package the path is returned as is, so
+        new parts can be written there.
+        """
+        path = _member_path(self.root, name)
+        if path.is_file() or name not in self:
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self.archive.open(name) as source, open(path, "wb") as out:
+            if _is_xml(name):
+                pretty_print_xml(source, out)
+            else:
+                shutil.copyfileobj(source, out)
+        return path
+
+    def remove(self, name):
+        """Remove a part from the package (on disk and, if partial, the archive)."""
+        path = self.root / name
+        if path.is_file():
+            path.unlink()
+        if self.source is not None and name in self.archive.NameToInfo:
+            self.removed.add(name)
+            self._write_manifest()
+
+    def close(self):
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def _check_in_archive(self, name):
+        if self.source is None or name in self.removed:
+            raise KeyError(name)
+        self.archive.getinfo(name)
+
+    def _write_manifest(self):
+        manifest = {"source": str(self.source), "removed": sorted(self.removed)}
+        (self.root / PACKAGE_MANIFEST).write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+
+
+def pretty_print_xml(source, target):
+    """Pretty-print XML from a binary stream into a binary stream.
+
+    The output is byte-for-byte what minidom's toprettyxml(indent="  ",
+    encoding="ascii") gives, but the document is never held in memory.
+
+    Args:
+        source: Readable binary file object with the XML
+        target: Writable binary file object for the formatted XML
+    """
+    writer = io.TextIOWrapper(
+        target, encoding=ENCODING, errors="xmlcharrefreplace", newline="\n"
+    )
+    handler = _PrettyPrinter(writer)
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setProperty(property_lexical_handler, handler)
+    parser.parse(source)
+    writer.flush()
+    writer.detach()
+
+
+def _is_xml(name):
+    return name.endswith(".xml") or name.endswith(".rels")
+
+
+def _matches(name, globs):
+    """True if name equals one of the globs or matches it as a pattern.
+
+    Exact names are checked first, since "[Content_Types].xml" would otherwise
+    be read as a character class.
+    """
+    return any(
+        name == pattern or fnmatch.fnmatchcase(name, pattern) for pattern in globs
+    )
+
+
+def _run_tasks(tasks, output_path, jobs):
+    """Format parts, fanning out to a process pool when it pays off."""
+    jobs = jobs or os.cpu_count() or 1
+    total = sum(size for _, _, size in tasks)
+    if jobs <= 1 or len(tasks) <= 1 or total < MIN_PARALLEL_BYTES:
+        for task in tasks:
+            _format_part(task, output_path)
+        return
+
+    # Largest parts first so one big part does not finish last on its own
+    tasks.sort(key=lambda task: task[2], reverse=True)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        for _ in executor.map(
+            _format_part, tasks, [output_path] * len(tasks), chunksize=chunksize
+        ):
+            pass
+
+
+def _format_part(task, output_path):
+    """Pretty-print one part, either from the archive or in place on disk."""
+    archive, name, _ = task
+    if archive is not None:
+        target = _member_path(output_path, name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with _open_archive(archive).open(name) as source, open(target, "wb") as out:
+            pretty_print_xml(source, out)
+        return
+
+    path = Path(name)
+    formatted = path.with_name(path.name + ".tmp")
+    with open(path, "rb") as source, open(formatted, "wb") as out:
+        pretty_print_xml(source, out)
+    os.replace(formatted, path)
+
+
+def _member_path(output_path, name):
+    """Resolve an archive member name inside output_path, rejecting escapes."""
+    parts = Path(name.replace("\\", "/")).parts
+    if Path(name).is_absolute() or ".." in parts:
+        raise ValueError(f"Unsafe member name in archive: {name}")
+    return Path(output_path).joinpath(*parts)
+
+
+_archives = {}
+
+
+def _open_archive(path):
+    """Return a ZipFile for path, kept open for the life of the (worker) process."""
+    archive = _archives.get(path)
+    if archive is None:
+        archive = _archives[path] = zipfile.ZipFile(path)
+    return archive
+
+
+class _PrettyPrinter(ContentHandler):
+    """SAX handler that writes minidom-style pretty-printed XML.
+
+    minidom writes an element's start tag, then either its single text child
+    inline or every child on its own indented line. Since that choice depends on
+    the children, each open element keeps its start tag unterminated and buffers
+    consecutive text/CDATA children until the next child element, comment,
+    processing instruction or end tag decides the layout.
+    """
+
+    def __init__(self, writer):
+        super().__init__()
+        self.write = writer.write
+        # Each frame: [tag name, indent for children, start tag closed?, leaves]
+        self.stack = [[None, "", True, []]]
+        self.in_cdata = False
+
+    # ContentHandler
+
+    def startDocument(self):
+        self.write(f'<?xml version="1.0" encoding="{ENCODING}"?>{NEWLINE}')
+
+    def startElement(self, name, attrs):
+        indent = self._open_child()
+        self.write(f"{indent}<{name}")
+        # minidom lists namespace declarations before other attributes
+        names = attrs.getNames()
+        ordered = [n for n in names if n == "xmlns" or n.startswith("xmlns:")]
+        ordered += [n for n in names if n != "xmlns" and not n.startswith("xmlns:")]
+        for attr in ordered:
+            self.write(f' {attr}="{_escape(attrs.getValue(attr))}"')
+        self.stack.append([name, indent + INDENT, False, []])
+
+    def endElement(self, name):
+        _, child_indent, closed, leaves = self.stack.pop()
+        indent = child_indent[: -len(INDENT)]
+        if not closed:
+            if not leaves:
+                self.write(f"/>{NEWLINE}")
+                return
+            if len(leaves) == 1:
+                self.write(">")
+                self._write_leaf(leaves[0], "", "")
+                self.write(f"</{name}>{NEWLINE}")
+                return
+            self.write(">" + NEWLINE)
+        self._flush_leaves(child_indent, leaves)
+        self.write(f"{indent}</{name}>{NEWLINE}")
+
+    def characters(self, content):
+        leaves = self.stack[-1][3]
+        if self.in_cdata:
+            leaves[-1][1].append(content)
+        elif leaves and not leaves[-1][0]:
+            leaves[-1][1].append(content)
+        else:
+            leaves.append((False, [content]))
+
+    def processingInstruction(self, target, data):
+        indent = self._open_child()
+        self.write(f"{indent}<?{target} {data}?>{NEWLINE}")
+
+    # LexicalHandler
+
+    def comment(self, content):
+        indent = self._open_child()
+        self.write(f"{indent}<!--{content}-->{NEWLINE}")
+
+    def startCDATA(self):
+        self.stack[-1][3].append((True, []))
+        self.in_cdata = True
+
+    def endCDATA(self):
+        self.in_cdata = False
+
+    def startDTD(self, name, public_id, system_id):
+        pass
+
+    def endDTD(self):
+        pass
+
+    # Helpers
+
+    def _open_child(self):
+        """Switch the current element to one-child-per-line layout.
+
+        Returns:
+            str: Indentation for the new child
+        """
+        frame = self.stack[-1]
+        if not frame[2]:
+            self.write(">" + NEWLINE)
+            frame[2] = True
+        self._flush_leaves(frame[1], frame[3])
+        return frame[1]
+
+    def _flush_leaves(self, indent, leaves):
+        for leaf in leaves:
+            self._write_leaf(leaf, indent, NEWLINE)
+        leaves.clear()
+
+    def _write_leaf(self, leaf, indent, newline):
+        is_cdata, chunks = leaf
+        if is_cdata:
+            self.write("<![CDATA[" + "".join(chunks) + "]]>")
+        else:
+            self.write(_escape(indent + "".join(chunks) + newline))
+
+
+def _escape(data):
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
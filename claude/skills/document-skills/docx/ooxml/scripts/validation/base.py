@@ -2,11 +2,20 @@
 Base validator with common validation logic for document files.
 """
 
+import json
+import os
 import re
+import shutil
+import tempfile
+import weakref
+import zipfile
 from pathlib import Path
 
 import lxml.etree
 
+# Manifest of a partially unpacked tree (written by unpack.py --parts/--lazy)
+PACKAGE_MANIFEST = ".ooxml-package.json"
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -108,6 +117,10 @@ class BaseSchemaValidator:
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # A partially unpacked tree is validated as the whole package
+        if (self.unpacked_dir / PACKAGE_MANIFEST).exists():
+            self.unpacked_dir = self._complete_partial_tree(self.unpacked_dir)
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -120,6 +133,45 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+    def _complete_partial_tree(self, unpacked_dir):
+        """Build a temporary full tree for a partially unpacked one.
+
+        Unpacked parts are linked in; XML parts still in the source archive are
+        extracted as they are. Other parts (media) only need to exist for the
+        checks here, so they are represented by empty files.
+
+        Returns:
+            Path: Directory with every part of the package
+        """
+        manifest = json.loads(
+            (unpacked_dir / PACKAGE_MANIFEST).read_text(encoding="utf-8")
+        )
+        removed = set(manifest.get("removed", []))
+        view = Path(tempfile.mkdtemp(prefix="ooxml-validate-"))
+        weakref.finalize(self, shutil.rmtree, view, ignore_errors=True)
+
+        for path in unpacked_dir.rglob("*"):
+            if not path.is_file() or path.name == PACKAGE_MANIFEST:
+                continue
+            target = view / path.relative_to(unpacked_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
+
+        with zipfile.ZipFile(manifest["source"]) as source:
+            for info in source.infolist():
+                target = view / info.filename
+                if info.is_dir() or info.filename in removed or target.exists():
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if info.filename.endswith((".xml", ".rels")):
+                    target.write_bytes(source.read(info))
+                else:
+                    target.touch()
+        return view.resolve()
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -7,6 +7,8 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from .base import PACKAGE_MANIFEST
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -23,6 +25,14 @@ class RedliningValidator:
         """Main validation method that returns True if valid, False otherwise."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
+        if (
+            not modified_file.exists()
+            and (self.unpacked_dir / PACKAGE_MANIFEST).exists()
+        ):
+            # Partially unpacked and document.xml was never unpacked: unchanged
+            if self.verbose:
+                print("PASSED - document.xml was not unpacked, so it is unchanged.")
+            return True
         if not modified_file.exists():
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
@@ -17,32 +17,81 @@ Usage:
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
 
+    # Add many comments at once (written in a single pass on save)
+    ids = doc.add_comments([(node, node, "First"), (None, None, "Reply", ids[0])])
+
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Locate edits by text, even when it spans runs
+    runs = doc.text.select_runs(doc.text.find("obsolete clause"))
+    doc.add_comment(start=runs[0], end=runs[-1], text="Remove?")
+
+    # Apply many edits as one validated, all-or-nothing batch
+    with doc.transaction() as tx:
+        tx.suggest_deletion({"tag": "w:r", "contains": "obsolete"})
+        tx.insert_after(node, "<w:ins><w:r><w:t>new</w:t></w:r></w:ins>")
+
     # Save
     doc.save()
+    doc.save(destination="output.docx")  # Write a .docx directly
 """
 
+import difflib
 import html
+import os
 import random
+import re
 import shutil
 import tempfile
+import weakref
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.pack import condense_xml_bytes, copy_raw_member, pack_document
+from ooxml.scripts.unpack import PACKAGE_MANIFEST, PackageView, pretty_print_xml
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
+from .document_text import DocumentText, read_paragraph, split_run
 from .utilities import XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Approximate in-memory size of a parsed minidom tree relative to its XML file
+EDITOR_MEMORY_FACTOR = 40
+
+# Parameterized fragments, compiled once per editor via XMLEditor.render_fragment.
+# Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
+# and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
+COMMENT_RANGE_START_TEMPLATE = '<w:commentRangeStart w:id="{id}"/>'
+COMMENT_RANGE_END_TEMPLATE = '<w:commentRangeEnd w:id="{id}"/>'
+COMMENT_REF_RUN_TEMPLATE = """<w:r>
+  <w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>
+  <w:commentReference w:id="{id}"/>
+</w:r>"""
+COMMENT_TEMPLATE = """<w:comment w:id="{id}">
+  <w:p w14:paraId="{para_id}" w14:textId="77777777">
+    <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
+    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{text}</w:t></w:r>
+  </w:p>
+</w:comment>"""
+COMMENT_EX_TEMPLATE = '<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
+COMMENT_EX_REPLY_TEMPLATE = '<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+COMMENT_ID_TEMPLATE = (
+    '<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+)
+COMMENT_EXTENSIBLE_TEMPLATE = (
+    '<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+)
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -71,6 +120,19 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        # Nodes awaiting attribute injection while inside deferred_injection()
+        self._deferred_nodes = None
+        # Callbacks told about nodes touched by each edit (see add_change_listener)
+        self._change_listeners = []
+
+    def add_change_listener(self, callback):
+        """Register callback(nodes), called with the nodes touched by each edit.
+
+        Every edit made through this editor (insert_*, append_to, replace_node,
+        suggest_deletion, revert_*) reports the inserted or wrapped nodes, which
+        lets derived views such as DocumentText update incrementally.
+        """
+        self._change_listeners.append(callback)
 
     def _get_next_change_id(self):
         """Get the next available change ID by checking all tracked change elements."""
@@ -113,6 +175,30 @@ class DocxXMLEditor(XMLEditor):
                 "http://schemas.microsoft.com/office/word/2010/wordml",
             )
 
+    @contextmanager
+    def deferred_injection(self):
+        """Collect inserted nodes and inject their attributes in one sweep on exit.
+
+        Used for batches of edits: tracked change IDs are then allocated from a
+        single scan of the document instead of one scan per edit. If the block
+        raises, no attributes are injected.
+
+        Example:
+            with editor.deferred_injection():
+                editor.insert_after(node, "<w:ins><w:r><w:t>a</w:t></w:r></w:ins>")
+                editor.suggest_deletion(other_node)
+        """
+        if self._deferred_nodes is not None:
+            # Already inside a batch: the outer block injects everything
+            yield
+            return
+        nodes = self._deferred_nodes = []
+        try:
+            yield
+        finally:
+            self._deferred_nodes = None
+        self._inject_attributes_to_nodes(nodes)
+
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
 
@@ -127,9 +213,24 @@ class DocxXMLEditor(XMLEditor):
         Args:
             nodes: List of DOM nodes to process
         """
+        for callback in self._change_listeners:
+            callback(nodes)
+        if self._deferred_nodes is not None:
+            self._deferred_nodes.extend(nodes)
+            return
+
         from datetime import datetime, timezone
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Next tracked change ID, found with one scan the first time it is needed
+        next_change_id = []
+
+        def allocate_change_id():
+            if not next_change_id:
+                next_change_id.append(self._get_next_change_id())
+            change_id = next_change_id[0]
+            next_change_id[0] += 1
+            return str(change_id)
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
@@ -167,7 +268,7 @@ class DocxXMLEditor(XMLEditor):
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                elem.setAttribute("w:id", allocate_change_id())
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -592,6 +693,491 @@ class DocxXMLEditor(XMLEditor):
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
+    def suggest_deletion_range(self, start, end):
+        """Mark everything from start to end (inclusive) as deleted, in one pass.
+
+        Runs between the two elements, in document order, are converted to
+        deleted runs (w:t → w:delText, w:rsidR → w:rsidDel) and each group of
+        adjacent runs is wrapped in a single <w:del>. Runs inside another
+        author's <w:ins> get the <w:del> nested inside it. The paragraph mark of
+        every paragraph in the range, empty ones included, is marked deleted
+        too, so accepting the change merges them as Word does. The paragraph
+        holding end keeps its mark when end is a run; when end is a whole w:p
+        its mark is deleted, as with suggest_deletion. All IDs and attributes
+        are assigned in one sweep.
+
+        Runs that are already deleted or hold comment references are skipped.
+        To start or end mid-run, split the runs first with Document.text
+        (see Document.suggest_deletion_text).
+
+        Args:
+            start: First w:r or w:p of the range
+            end: Last w:r or w:p of the range (may be the same as start)
+
+        Returns:
+            list: The <w:del> wrappers that were created
+
+        Raises:
+            ValueError: If the range contains no runs or paragraph marks to delete
+
+        Example:
+            first = doc["word/document.xml"].get_node(tag="w:p", contains="Section 4")
+            last = doc["word/document.xml"].get_node(tag="w:p", contains="End of Section 4")
+            doc["word/document.xml"].suggest_deletion_range(first, last)
+        """
+        runs = [
+            run
+            for run in self._elements_in_range(start, end, "w:r")
+            if not _has_ancestor(run, "w:del")
+            and not run.getElementsByTagName("w:commentReference")
+            and not run.getElementsByTagName("w:delText")
+        ]
+
+        # Paragraphs whose marks are deleted: every one in the range (plus the
+        # one holding start, if start is a run) except those that hold end
+        paragraphs = self._elements_in_range(start, end, "w:p")
+        first = _enclosing_tag(start, "w:p")
+        if first is not None and first is not start:
+            paragraphs.insert(0, first)
+        holds_end = set()
+        node = end.parentNode
+        while node is not None:
+            holds_end.add(node)
+            node = node.parentNode
+        paragraphs = [p for p in paragraphs if p not in holds_end]
+
+        if not runs and not paragraphs:
+            raise ValueError("suggest_deletion_range found nothing to delete")
+
+        with self.deferred_injection():
+            wrappers = self._wrap_runs_as_deleted(runs)
+            for paragraph in paragraphs:
+                marker = self._mark_paragraph_mark(paragraph, "w:del")
+                if marker is not None:
+                    wrappers.append(marker)
+            self._inject_attributes_to_nodes(wrappers)
+        return wrappers
+
+    def suggest_text_change(self, start, new_text, end=None):
+        """Turn paragraphs into new_text with minimal word-level tracked changes.
+
+        The current visible text of each paragraph is diffed word by word
+        against the target, and only the differing words are wrapped in
+        <w:del>/<w:ins>. Inserted runs copy the w:rPr of the neighbouring run,
+        so formatting is kept. A "\n" within a paragraph's text stands for a
+        w:br or w:cr line break, as in doc.text.
+
+        For a range of paragraphs, new_text is a list with one string per w:p
+        from start to end, in the order of doc.text.paragraphs. Paragraphs are
+        aligned first, so unchanged ones are left alone, changed ones are
+        diffed internally, and extra old or new strings become whole-paragraph
+        deletions or insertions.
+
+        Args:
+            start: The w:p to rewrite (or the first w:p of a range)
+            new_text: Desired text of start, or a list of paragraph texts
+            end: Optional last w:p of the range (new_text must then be a list)
+
+        Returns:
+            list: The <w:ins>/<w:del> elements and paragraphs that were created
+
+        Example:
+            para = doc["word/document.xml"].get_node(tag="w:p", contains="within 30 days")
+            doc["word/document.xml"].suggest_text_change(
+                para, "Payment is due within 60 days of the invoice date."
+            )
+        """
+        if isinstance(new_text, str):
+            if end is not None and end is not start:
+                raise ValueError(
+                    "suggest_text_change needs a list of paragraph texts for a range"
+                )
+            paragraphs = [start]
+            new_texts = [new_text]
+        else:
+            paragraphs = self._elements_in_range(start, end or start, "w:p")
+            new_texts = list(new_text)
+        old_texts = [read_paragraph(p)[0] for p in paragraphs]
+
+        created = []
+        with self.deferred_injection():
+            matcher = difflib.SequenceMatcher(
+                None, old_texts, new_texts, autojunk=False
+            )
+            # Work backwards so earlier paragraphs keep their positions
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == "equal":
+                    continue
+                paired = min(i2 - i1, j2 - j1)
+                for offset in range(i2 - i1 - 1, paired - 1, -1):
+                    created.extend(self._delete_paragraph(paragraphs[i1 + offset]))
+                if j2 - j1 > paired:
+                    anchor = paragraphs[i1 + paired - 1] if i1 + paired > 0 else None
+                    before = paragraphs[i1 + paired] if anchor is None else None
+                    created.extend(
+                        self._insert_paragraphs(
+                            anchor, before, new_texts[j1 + paired : j2], paragraphs
+                        )
+                    )
+                for offset in range(paired - 1, -1, -1):
+                    created.extend(
+                        self._diff_paragraph(
+                            paragraphs[i1 + offset], new_texts[j1 + offset]
+                        )
+                    )
+            self._inject_attributes_to_nodes(created)
+        return created
+
+    def _diff_paragraph(self, paragraph, new_text):
+        """Apply a word-level diff of one paragraph against new_text."""
+        old_text = read_paragraph(paragraph)[0]
+        old_tokens = _tokenize(old_text)
+        new_tokens = _tokenize(new_text)
+        old_offsets = _token_offsets(old_tokens)
+        new_offsets = _token_offsets(new_tokens)
+
+        created = []
+        matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            start, end = old_offsets[i1], old_offsets[i2]
+            inserted = new_text[new_offsets[j1] : new_offsets[j2]]
+            # The run whose formatting new text inherits
+            template_run = self._run_at(paragraph, max(start - 1, 0))
+            anchor = None
+            if end > start:
+                runs = self._isolate_runs(paragraph, start, end)
+                wrappers = self._wrap_runs_as_deleted(runs)
+                created.extend(wrappers)
+                anchor = wrappers[-1]
+            if inserted:
+                created.append(
+                    self._insert_text_run(
+                        paragraph, start, inserted, template_run, after=anchor
+                    )
+                )
+        return created
+
+    def _delete_paragraph(self, paragraph):
+        """Track-delete a paragraph's runs and its paragraph mark."""
+        runs = [
+            run
+            for run in paragraph.getElementsByTagName("w:r")
+            if not _has_ancestor(run, "w:del")
+            and not run.getElementsByTagName("w:commentReference")
+            and not run.getElementsByTagName("w:delText")
+        ]
+        created = self._wrap_runs_as_deleted(runs)
+        marker = self._mark_paragraph_mark(paragraph, "w:del")
+        if marker is not None:
+            created.append(marker)
+        return created
+
+    def _insert_paragraphs(self, anchor, before, texts, paragraphs):
+        """Insert tracked paragraphs after anchor (or before `before`).
+
+        New paragraphs copy the w:pPr of a neighbouring paragraph and the w:rPr
+        of its first run.
+        """
+        model = anchor if anchor is not None else before
+        pPr = next((c for c in model.childNodes if c.nodeName == "w:pPr"), None)
+        pPr_xml = ""
+        if pPr is not None:
+            pPr = pPr.cloneNode(True)
+            for marker in [
+                m
+                for m in pPr.getElementsByTagName("w:ins")
+                + pPr.getElementsByTagName("w:del")
+            ]:
+                marker.parentNode.removeChild(marker)
+            pPr_xml = pPr.toxml()
+        first_run = next(iter(model.getElementsByTagName("w:r")), None)
+        rPr_xml = _run_properties_xml(first_run)
+
+        xml = "".join(
+            self.suggest_paragraph(
+                f"<w:p>{pPr_xml}<w:r>{rPr_xml}"
+                f'<w:t xml:space="preserve">{html.escape(text, quote=False)}</w:t>'
+                f"</w:r></w:p>"
+            )
+            for text in texts
+        )
+        if anchor is not None:
+            return self.insert_after(anchor, xml)
+        return self.insert_before(before, xml)
+
+    def _run_at(self, paragraph, offset):
+        """Return the run holding the character at offset in a paragraph."""
+        segments = read_paragraph(paragraph)[1]
+        for start, end, run, _ in segments:
+            if start <= offset < end and run is not None:
+                return run
+        runs = [run for _, _, run, _ in segments if run is not None]
+        return runs[-1] if runs else None
+
+    def _isolate_runs(self, paragraph, start, end):
+        """Split runs at start and end and return the runs covering [start, end)."""
+        for boundary in (end, start):
+            for seg_start, seg_end, run, elem in read_paragraph(paragraph)[1]:
+                if _splits_at(seg_start, seg_end, run, elem, boundary):
+                    split_run(run, elem, boundary - seg_start)
+                    break
+        runs = []
+        for seg_start, seg_end, run, _ in read_paragraph(paragraph)[1]:
+            if seg_start < end and seg_end > start and run is not None:
+                if not runs or runs[-1] is not run:
+                    runs.append(run)
+        return runs
+
+    def _insert_text_run(self, paragraph, offset, text, template_run, after=None):
+        """Insert a tracked run with text at offset, formatted like template_run.
+
+        If after is given the insertion goes right after it (e.g. after the
+        deletion it replaces); otherwise the run at offset is split if needed.
+        """
+        rPr_xml = _run_properties_xml(template_run)
+        xml = (
+            f"<w:ins><w:r>{rPr_xml}"
+            f'<w:t xml:space="preserve">{html.escape(text, quote=False)}</w:t>'
+            f"</w:r></w:ins>"
+        )
+        if after is not None:
+            return self.insert_after(after, xml)[0]
+
+        segments = read_paragraph(paragraph)[1]
+        for seg_start, seg_end, run, elem in segments:
+            if _splits_at(seg_start, seg_end, run, elem, offset):
+                split_run(run, elem, offset - seg_start)
+                segments = read_paragraph(paragraph)[1]
+                break
+        following = next(
+            (run for start, _, run, _ in segments if start >= offset and run), None
+        )
+        if following is not None:
+            return self.insert_before(_outside_changes(following), xml)[0]
+        preceding = [run for _, _, run, _ in segments if run is not None]
+        if preceding:
+            return self.insert_after(_outside_changes(preceding[-1]), xml)[0]
+        return self.append_to(paragraph, xml)[0]
+
+    def _wrap_runs_as_deleted(self, runs):
+        """Convert runs to deleted runs and wrap adjacent groups in w:del.
+
+        Returns the new <w:del> wrappers; attributes are not injected here.
+        """
+        groups = []
+        for run in runs:
+            previous = groups[-1][-1] if groups else None
+            if previous is not None and _next_element(previous) is run:
+                groups[-1].append(run)
+            else:
+                groups.append([run])
+
+        wrappers = []
+        for group in groups:
+            for run in group:
+                self._convert_run_to_deleted(run)
+            del_wrapper = self.dom.createElement("w:del")
+            group[0].parentNode.insertBefore(del_wrapper, group[0])
+            for run in group:
+                del_wrapper.appendChild(run)
+            wrappers.append(del_wrapper)
+        return wrappers
+
+    def revert_insertion_range(self, start, end, author=None):
+        """Reject every insertion between start and end, optionally by one author.
+
+        Runs as a single pass over the range: matching <w:ins> elements are
+        collected in document order, then rejected as revert_insertion does,
+        with all new IDs and attributes assigned in one sweep.
+
+        Args:
+            start: First element of the range (e.g. a w:p or w:ins)
+            end: Last element of the range (may be the same as start)
+            author: If given, only insertions with this w:author are rejected
+
+        Returns:
+            list: The <w:ins> elements that were rejected
+
+        Example:
+            body = doc["word/document.xml"].get_node(tag="w:body")
+            doc["word/document.xml"].revert_insertion_range(body, body, author="Bot")
+        """
+        insertions = [
+            ins
+            for ins in self._elements_in_range(start, end, "w:ins")
+            if (author is None or ins.getAttribute("w:author") == author)
+            and ins.getElementsByTagName("w:t")
+        ]
+        with self.deferred_injection():
+            for ins in insertions:
+                self.revert_insertion(ins)
+        return insertions
+
+    def revert_deletion_range(self, start, end, author=None):
+        """Reject every deletion between start and end, optionally by one author.
+
+        The counterpart of revert_insertion_range: matching <w:del> elements
+        are re-inserted as revert_deletion does, in a single sweep.
+
+        Args:
+            start: First element of the range
+            end: Last element of the range (may be the same as start)
+            author: If given, only deletions with this w:author are rejected
+
+        Returns:
+            list: The <w:del> elements that were rejected
+        """
+        deletions = [
+            deletion
+            for deletion in self._elements_in_range(start, end, "w:del")
+            if (author is None or deletion.getAttribute("w:author") == author)
+            and deletion.getElementsByTagName("w:r")
+        ]
+        with self.deferred_injection():
+            for deletion in deletions:
+                self.revert_deletion(deletion)
+        return deletions
+
+    def _elements_in_range(self, start, end, tag):
+        """Elements with tag from start through the end of end's subtree.
+
+        Walks the document once in document order. start and end themselves
+        are included if they have the tag.
+        """
+        found = []
+        collecting = False
+        stop_marker = object()
+        stack = [self.dom.documentElement]
+        while stack:
+            node = stack.pop()
+            if node is stop_marker:
+                return found
+            if node is start:
+                collecting = True
+            if collecting and node.tagName == tag:
+                found.append(node)
+            if node is end:
+                if not collecting:
+                    raise ValueError("Range end comes before range start")
+                stack.append(stop_marker)
+            stack.extend(
+                child
+                for child in reversed(node.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
+        raise ValueError("Range start or end is not part of this document")
+
+    def _convert_run_to_deleted(self, run):
+        """Convert w:t to w:delText and w:rsidR to w:rsidDel in a run."""
+        for t_elem in list(run.getElementsByTagName("w:t")):
+            del_text = self.dom.createElement("w:delText")
+            while t_elem.firstChild:
+                del_text.appendChild(t_elem.firstChild)
+            for i in range(t_elem.attributes.length):
+                attr = t_elem.attributes.item(i)
+                del_text.setAttribute(attr.name, attr.value)
+            t_elem.parentNode.replaceChild(del_text, t_elem)
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+
+    def _mark_paragraph_mark(self, paragraph, tag):
+        """Add an empty w:ins/w:del marker to a paragraph's w:pPr/w:rPr.
+
+        Returns the marker, or None if the paragraph mark is already marked.
+        """
+        pPr = next((c for c in paragraph.childNodes if c.nodeName == "w:pPr"), None)
+        if pPr is None:
+            pPr = self.dom.createElement("w:pPr")
+            paragraph.insertBefore(pPr, paragraph.firstChild)
+        rPr = next((c for c in pPr.childNodes if c.nodeName == "w:rPr"), None)
+        if rPr is None:
+            rPr = self.dom.createElement("w:rPr")
+            pPr.appendChild(rPr)
+        if any(c.nodeName in ("w:ins", "w:del") for c in rPr.childNodes):
+            return None
+        marker = self.dom.createElement(tag)
+        rPr.insertBefore(marker, rPr.firstChild)
+        return marker
+
+
+def _has_ancestor(elem, tag):
+    """Check whether any ancestor of elem has the given tag."""
+    return _enclosing_tag(elem.parentNode, tag) is not None
+
+
+def _enclosing_tag(elem, tag):
+    """Return elem or its nearest ancestor with the given tag (or None)."""
+    node = elem
+    while node is not None and node.nodeType == node.ELEMENT_NODE:
+        if node.tagName == tag:
+            return node
+        node = node.parentNode
+    return None
+
+
+def _splits_at(seg_start, seg_end, run, elem, offset):
+    """Check whether a run must be split at offset within a read_paragraph segment.
+
+    Offsets inside a w:t split its text; an offset at the start of any segment
+    splits the run before that element (a no-op for the run's first element).
+    """
+    if run is None or not seg_start <= offset < seg_end:
+        return False
+    return offset == seg_start or elem.tagName == "w:t"
+
+
+def _next_element(elem):
+    """Return the next element sibling, skipping whitespace text nodes."""
+    node = elem.nextSibling
+    while node is not None and node.nodeType != node.ELEMENT_NODE:
+        if node.nodeType == node.TEXT_NODE and node.data.strip():
+            return None
+        node = node.nextSibling
+    return node
+
+
+def _outside_changes(run):
+    """Return the outermost w:ins/w:del around a run, or the run itself."""
+    node = run
+    while node.parentNode is not None and node.parentNode.nodeName in (
+        "w:ins",
+        "w:del",
+    ):
+        node = node.parentNode
+    return node
+
+
+def _run_properties_xml(run):
+    """Return the XML of a run's w:rPr (without change markers), or ''."""
+    if run is None:
+        return ""
+    rPr = next((c for c in run.childNodes if c.nodeName == "w:rPr"), None)
+    if rPr is None:
+        return ""
+    rPr = rPr.cloneNode(True)
+    for child in list(rPr.childNodes):
+        if child.nodeName in ("w:ins", "w:del", "w:rPrChange"):
+            rPr.removeChild(child)
+    return rPr.toxml()
+
+
+def _tokenize(text):
+    """Split text into words, whitespace runs and single punctuation marks."""
+    return re.findall(r"\w+|\s+|[^\w\s]", text)
+
+
+def _token_offsets(tokens):
+    """Character offset of each token, plus the total length at the end."""
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return offsets
+
 
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
@@ -609,6 +1195,61 @@ def _generate_rsid() -> str:
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+class _EvictedEditor:
+    """An evicted editor, kept alive for as long as its DOM is referenced.
+
+    The DOM refers back to this object, so a caller holding any node of the
+    part also holds its editor, which is reused if the part is reopened. Once
+    the DOM is collected, it is spilled to the overlay if it was modified.
+    """
+
+    def __init__(self, editor, overlay_root: Path, xml_path, original_file: Path):
+        self.editor = editor
+        self.overlay_root = overlay_root
+        self.xml_path = xml_path
+        self.original_file = original_file
+        editor.dom._evicted_editor = self
+
+    def release(self):
+        """Return the editor for reuse; nothing is spilled afterwards."""
+        editor, self.editor = self.editor, None
+        del editor.dom._evicted_editor
+        return editor
+
+    def __del__(self):
+        if self.editor is not None:
+            _spill_dom(
+                self.editor.dom,
+                self.editor.encoding,
+                self.overlay_root,
+                self.xml_path,
+                self.original_file,
+            )
+
+
+def _spill_dom(dom, encoding, overlay_root: Path, xml_path, original_file: Path):
+    """Write an evicted editor's DOM to the overlay once it is no longer used.
+
+    Skipped if the DOM is unchanged or the session's temp directory is gone.
+    """
+    if not overlay_root.exists():
+        return
+    overlay_file = overlay_root / xml_path
+    content = dom.toxml(encoding=encoding)
+    source = overlay_file if overlay_file.exists() else original_file
+    if source.exists() and source.read_bytes() == content:
+        return
+    overlay_file.parent.mkdir(parents=True, exist_ok=True)
+    overlay_file.write_bytes(content)
+
+
+def _relative_files(root: Path) -> set:
+    """Relative paths of all files below root (empty if root does not exist)."""
+    if not root.exists():
+        return set()
+    return {f.relative_to(root) for f in root.rglob("*") if f.is_file()}
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -619,31 +1260,55 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        original_file=None,
+        editor_memory_budget=None,
     ):
         """
         Initialize with path to unpacked Word document directory.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
         Args:
-            unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
+            unpacked_dir: Path to unpacked DOCX directory. It may be partially
+                unpacked (unpack.py --parts or --lazy); parts that are not on
+                disk are then read from the source archive in its manifest.
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            original_file: Optional .docx the directory was unpacked from (and not
+                edited since). Used as the validation baseline instead of packing
+                one, and as the source of unmodified parts when saving to a .docx.
+            editor_memory_budget: Optional approximate limit in bytes for parsed
+                parts kept in memory. Least recently used editors beyond it are
+                written to the working directory if modified and dropped, then
+                re-read on next access. word/document.xml is always kept.
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        self.original_file = Path(original_file) if original_file else None
+        if self.original_file and not zipfile.is_zipfile(self.original_file):
+            raise ValueError(f"Not a .docx file: {original_file}")
+
+        # Copy-on-write working set: the original directory is only read, and
+        # parts that are created or modified are written to an overlay directory
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.unpacked_path.mkdir()
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Parts of a partially unpacked tree that are only in its source
+        # archive are extracted here when first read (see _original_part)
+        self._package = PackageView(self.original_path)
+        self.archive_path = Path(self.temp_dir) / "archive"
+
+        # Validation baseline (.docx of the original), packed on first use. Parts
+        # overwritten in the original directory before then are preserved in
+        # baseline_path (or listed in _baseline_added if they were new)
+        self._original_docx = None
+        self.baseline_path = Path(self.temp_dir) / "baseline"
+        self._baseline_added = set()
 
         self.word_path = self.unpacked_path / "word"
 
@@ -655,8 +1320,20 @@ class Document:
         self.author = author
         self.initials = initials
 
-        # Cache for lazy-loaded editors
-        self._editors = {}
+        # LRU cache of lazy-loaded editors, bounded by editor_memory_budget
+        self.editor_memory_budget = editor_memory_budget
+        self._editors = OrderedDict()
+        self._editor_sizes = {}
+        # Evicted editors whose DOM is still referenced by callers (see
+        # _EvictedEditor). They are reused if the part is reopened, written on
+        # save, and spilled to the overlay when callers drop their nodes
+        self._evicted_editors = weakref.WeakValueDictionary()
+
+        # Text model of word/document.xml, built on first use of .text
+        self._text = None
+
+        # Comments queued by add_comments(), written by _flush_pending_comments()
+        self._pending_comments = []
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -700,15 +1377,26 @@ class Document:
             # Get node from comments.xml
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
-        if xml_path not in self._editors:
-            file_path = self.unpacked_path / xml_path
+        if xml_path in self._editors:
+            self._editors.move_to_end(xml_path)
+            return self._editors[xml_path]
+
+        file_path = self._resolve_part(xml_path)
+        evicted = self._evicted_editors.pop(xml_path, None)
+        editor = evicted.release() if evicted is not None else None
+        if editor is None:
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            editor = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
-        return self._editors[xml_path]
+            # Read from wherever the part lives, but always save into the overlay
+            editor.xml_path = self.unpacked_path / xml_path
+        self._editors[xml_path] = editor
+        self._editor_sizes[xml_path] = file_path.stat().st_size * EDITOR_MEMORY_FACTOR
+        self._evict_editors()
+        return editor
 
     def add_comment(self, start, end, text: str) -> int:
         """
@@ -727,6 +1415,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
+        self._flush_pending_comments()
         comment_id = self.next_comment_id
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
@@ -782,6 +1471,7 @@ class Document:
         """
         if parent_comment_id not in self.existing_comments:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
+        self._flush_pending_comments()
 
         parent_info = self.existing_comments[parent_comment_id]
         comment_id = self.next_comment_id
@@ -802,7 +1492,8 @@ class Document:
         )
         parent_ref_run = parent_ref_elem.parentNode
         self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
+            parent_ref_run,
+            self._document.render_fragment(COMMENT_RANGE_END_TEMPLATE, id=comment_id),
         )
         self._document.insert_after(
             parent_ref_run, self._comment_ref_run_xml(comment_id)
@@ -830,11 +1521,151 @@ class Document:
         self.next_comment_id += 1
         return comment_id
 
+    @property
+    def text(self) -> DocumentText:
+        """
+        Flattened text of word/document.xml mapped to paragraphs, runs and characters.
+
+        Built in one pass on first access and updated per paragraph after edits.
+        See document_text.DocumentText for find(), finditer(), locate() and
+        select_runs().
+
+        Example:
+            span = doc.text.find("Termination")
+            runs = doc.text.select_runs(span)
+            doc.add_comment(start=runs[0], end=runs[-1], text="Check notice period")
+        """
+        if self._text is None or self._text.editor is not self._document:
+            self._text = DocumentText(self._document)
+        return self._text
+
+    def suggest_deletion_text(self, span):
+        """
+        Mark a span of document text as deleted, splitting runs at its edges.
+
+        Args:
+            span: TextSpan from doc.text (or a (start, end) offset tuple)
+
+        Returns:
+            list: The <w:del> wrappers that were created
+
+        Example:
+            doc.suggest_deletion_text(doc.text.find("and any affiliates"))
+        """
+        runs = self.text.select_runs(span)
+        if not runs:
+            raise ValueError(f"No runs found for span {span}")
+        return self._document.suggest_deletion_range(runs[0], runs[-1])
+
+    def transaction(self, validate=True) -> "DocumentTransaction":
+        """
+        Start a batch of edits to word/document.xml that is applied atomically.
+
+        Edits are only recorded until commit() (or the end of a with block).
+        Node lookups are then resolved in one indexed pass, the edits are
+        applied in document order with a single attribute-injection sweep, and
+        the document is validated once. If anything fails, every edit in the
+        batch is rolled back and the error is re-raised.
+
+        Args:
+            validate: If True, runs validate() before accepting the batch
+
+        Returns:
+            DocumentTransaction collecting the edits
+
+        Example:
+            with doc.transaction() as tx:
+                tx.replace({"tag": "w:r", "contains": "old"}, replacement_xml)
+                tx.comment(para, para, "Reworded per review")
+        """
+        return DocumentTransaction(self, validate=validate)
+
+    def add_comments(self, specs) -> list[int]:
+        """
+        Queue many comments and replies to be written in a single pass.
+
+        Comment IDs are allocated immediately, but nothing is inserted until
+        save() or validate() (or the next add_comment/reply_to_comment call).
+        At that point the range markers are inserted and all four comment parts
+        are written with one fragment parse each, which keeps thousands of
+        comments fast.
+
+        Args:
+            specs: Iterable of (start, end, text) or (start, end, text, parent)
+                tuples, or dicts with the same keys. For a reply, parent is the
+                ID of an existing or previously queued comment, and start/end
+                are ignored (the reply shares the parent's range).
+
+        Returns:
+            List of comment IDs, in the same order as specs
+
+        Raises:
+            ValueError: If a parent comment does not exist, or a top-level
+                comment is missing its start or end element
+
+        Example:
+            ids = doc.add_comments([(para, para, "Check this clause")])
+            doc.add_comments([(None, None, "Agreed", ids[0])])
+        """
+        comment_ids = []
+        for spec in specs:
+            if isinstance(spec, dict):
+                start, end = spec.get("start"), spec.get("end")
+                text, parent = spec["text"], spec.get("parent")
+            else:
+                start, end, text, *rest = spec
+                parent = rest[0] if rest else None
+
+            if parent is not None:
+                if parent not in self.existing_comments:
+                    raise ValueError(f"Parent comment with id={parent} not found")
+            elif start is None or end is None:
+                raise ValueError("Comments require start and end elements")
+
+            comment_id = self.next_comment_id
+            para_id = _generate_hex_id()
+            self._pending_comments.append(
+                {
+                    "id": comment_id,
+                    "start": start,
+                    "end": end,
+                    "text": text,
+                    "parent": parent,
+                    "para_id": para_id,
+                    "durable_id": _generate_hex_id(),
+                }
+            )
+            self.existing_comments[comment_id] = {"para_id": para_id}
+            self.next_comment_id += 1
+            comment_ids.append(comment_id)
+        return comment_ids
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
+        if hasattr(self, "_package"):
+            self._package.close()
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
+    @property
+    def original_docx(self) -> Path:
+        """Path to a .docx of the original directory, packed on first access."""
+        if self.original_file:
+            return self.original_file
+        if self._original_docx is None:
+            self._original_docx = Path(self.temp_dir) / "original.docx"
+            if self.baseline_path.exists() or self._baseline_added:
+                baseline_view = self._link_tree(
+                    "baseline_view",
+                    [self.original_path, self.baseline_path],
+                    exclude=self._baseline_added,
+                )
+                pack_document(baseline_view, self._original_docx, validate=False)
+                shutil.rmtree(baseline_view)
+            else:
+                pack_document(self.original_path, self._original_docx, validate=False)
+        return self._original_docx
+
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
@@ -842,12 +1673,16 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
+        self._flush_pending_comments()
+
         # Create validators with current state
+        self._save_editors()
+        view_path = self._materialize_view()
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path, self.original_docx, verbose=False
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path, self.original_docx, verbose=False
         )
 
         # Run validations
@@ -861,33 +1696,268 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only parts that were created or modified are written when saving back
+        to the original directory; each one is replaced atomically.
+
+        If destination ends in .docx, the package is written directly as a zip.
+        Modified parts are serialized from memory, and unmodified parts are copied
+        from the original archive (original_file, or the validation baseline once
+        it exists) as raw compressed bytes.
 
         Args:
-            destination: Optional path to save to. If None, saves back to original directory.
+            destination: Optional path to save to (a directory or a .docx file).
+                If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
+        self._flush_pending_comments()
+
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._has_part(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
-
-        # Validate by default
+        # Write modified XML files to the overlay (validate() does this itself)
         if validate:
             self.validate()
+        else:
+            self._save_editors()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Write the overlay (and, for a new destination, untouched parts) out
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.suffix.lower() == ".docx":
+            self._write_package(target_path)
+        else:
+            self._write_working_set(target_path)
+
+    # ==================== Private: Working Set ====================
+
+    def _resolve_part(self, xml_path) -> Path:
+        """Return the overlay copy of a part if it exists, else the original."""
+        overlay_path = self.unpacked_path / xml_path
+        if overlay_path.exists():
+            return overlay_path
+        return self._original_part(xml_path)
+
+    def _original_part(self, xml_path) -> Path:
+        """Return the path of a part as it is in the original tree.
+
+        Parts that a partially unpacked tree only has in its source archive are
+        extracted (pretty-printed, as unpack.py does) to archive_path on first
+        access, so the original directory is still never written.
+        """
+        path = self.original_path / xml_path
+        name = Path(xml_path).as_posix()
+        if path.exists() or not self._package.is_partial or name not in self._package:
+            return path
+        extracted = self.archive_path / name
+        if not extracted.exists():
+            extracted.parent.mkdir(parents=True, exist_ok=True)
+            with self._package.open(name) as source, open(extracted, "wb") as out:
+                if name.endswith((".xml", ".rels")):
+                    pretty_print_xml(source, out)
+                else:
+                    shutil.copyfileobj(source, out)
+        return extracted
+
+    def _original_files(self) -> set:
+        """Relative paths of the parts on disk in the original directory."""
+        return _relative_files(self.original_path) - {Path(PACKAGE_MANIFEST)}
+
+    def _archive_only_parts(self) -> list:
+        """Names of parts that a partial tree only has in its source archive."""
+        if not self._package.is_partial:
+            return []
+        return [
+            name
+            for name in self._package.archive_names()
+            if name not in self._package.removed
+            and not (self.original_path / name).is_file()
+        ]
+
+    def _has_part(self, path) -> bool:
+        """Check whether an overlay path exists in the overlay or the original."""
+        return self._resolve_part(Path(path).relative_to(self.unpacked_path)).exists()
+
+    def _create_part_from_template(self, template_name, path):
+        """Create a new part in the overlay from a template file."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(TEMPLATE_DIR / template_name, path)
+
+    def _save_editors(self):
+        """Write editors whose serialized content differs from their source part."""
+        editors = {
+            xml_path: evicted.editor
+            for xml_path, evicted in self._evicted_editors.items()
+            if evicted.editor is not None
+        }
+        editors.update(self._editors)
+        for xml_path, editor in editors.items():
+            self._save_editor(xml_path, editor)
+
+    def _save_editor(self, xml_path, editor):
+        """Write one editor to the overlay if it differs from its source part."""
+        content = editor.dom.toxml(encoding=editor.encoding)
+        source = self._resolve_part(xml_path)
+        if source.exists() and source.read_bytes() == content:
+            return
+        editor.xml_path.parent.mkdir(parents=True, exist_ok=True)
+        editor.xml_path.write_bytes(content)
+
+    def _evict_editors(self):
+        """Drop least recently used editors until the memory budget is met.
+
+        Modified editors are spilled to the overlay first, so reopening the part
+        reads the edited version. While callers still hold nodes of an evicted
+        part, its editor is kept and reused instead (see _EvictedEditor). The
+        most recently used editor and word/document.xml are never evicted.
+        """
+        if self.editor_memory_budget is None:
+            return
+        total = sum(self._editor_sizes.values())
+        for xml_path in list(self._editors)[:-1]:
+            if total <= self.editor_memory_budget:
+                break
+            if xml_path == "word/document.xml":
+                continue
+            editor = self._editors.pop(xml_path)
+            total -= self._editor_sizes.pop(xml_path)
+            self._save_editor(xml_path, editor)
+            self._evicted_editors[xml_path] = _EvictedEditor(
+                editor, self.unpacked_path, xml_path, self._original_part(xml_path)
+            )
+
+    def _overlay_files(self):
+        """Relative paths of all parts in the overlay."""
+        return _relative_files(self.unpacked_path)
+
+    def _materialize_view(self) -> Path:
+        """Build a merged directory of original and overlay parts for validators."""
+        return self._link_tree("view", [self.original_path, self.unpacked_path])
+
+    def _link_tree(self, name, layers, exclude=()) -> Path:
+        """Merge directories into a fresh temp directory; later layers win.
+
+        Files are hard-linked where possible, so no part data is copied.
+        """
+        view_path = Path(self.temp_dir) / name
+        if view_path.exists():
+            shutil.rmtree(view_path)
+        sources = {}
+        for layer in layers:
+            for rel in _relative_files(layer):
+                sources[rel] = layer / rel
+        for rel, source in sources.items():
+            if rel in exclude:
+                continue
+            target = view_path / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+        return view_path
+
+    def _write_working_set(self, target_path):
+        """Write overlay parts to target_path, replacing each file atomically.
+
+        When target_path is not the original directory, untouched original
+        parts are copied there as well, including those a partially unpacked
+        tree only has in its source archive, so target_path is complete.
+        """
+        target_path.mkdir(parents=True, exist_ok=True)
+        overlay = self._overlay_files()
+
+        if target_path.resolve() != self.original_path.resolve():
+            untouched = {
+                rel: self.original_path / rel for rel in self._original_files()
+            }
+            for name in self._archive_only_parts():
+                untouched[Path(name)] = self._original_part(name)
+            for rel, source in untouched.items():
+                if rel in overlay:
+                    continue
+                (target_path / rel).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target_path / rel)
+        elif self._original_docx is None:
+            # Keep the pre-edit version of each part for a later validation
+            # baseline. Parts not on disk are left out of it, and a partial
+            # tree's baseline then takes them from the source archive
+            for rel in overlay:
+                saved = self.baseline_path / rel
+                if saved.exists() or rel in self._baseline_added:
+                    continue
+                if (self.original_path / rel).exists():
+                    saved.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(self.original_path / rel, saved)
+                else:
+                    self._baseline_added.add(rel)
+
+        # Stage every dirty part next to its destination first, then swap them in
+        staged = []
+        try:
+            for rel in overlay:
+                destination = target_path / rel
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = destination.with_name(f".{destination.name}.tmp")
+                shutil.copy2(self.unpacked_path / rel, temp_file)
+                staged.append((temp_file, destination))
+        except Exception:
+            for temp_file, _ in staged:
+                temp_file.unlink(missing_ok=True)
+            raise
+        for temp_file, destination in staged:
+            os.replace(temp_file, destination)
+
+    def _write_package(self, output_file):
+        """Write the working set straight into a .docx at output_file.
+
+        The zip is built next to output_file and moved into place once complete.
+        """
+        overlay = self._overlay_files()
+        parts = {rel.as_posix(): self.unpacked_path / rel for rel in overlay}
+        for rel in self._original_files() - overlay:
+            parts[rel.as_posix()] = self.original_path / rel
+        # Parts of a partial tree that were never unpacked or edited
+        for name in self._archive_only_parts():
+            parts.setdefault(name, None)
+
+        source_file = self.original_file or self._original_docx
+        source_zip = zipfile.ZipFile(source_file) if source_file else None
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = output_file.with_name(f".{output_file.name}.tmp")
+        try:
+            with zipfile.ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED) as zf:
+                # [Content_Types].xml conventionally comes first in the package
+                for name in sorted(parts, key=lambda n: n != "[Content_Types].xml"):
+                    if parts[name] is None:
+                        archive = self._package.archive
+                        copy_raw_member(archive, archive.getinfo(name), zf)
+                        continue
+                    editor = self._editors.get(name)
+                    info = None
+                    if source_zip and Path(name) not in overlay:
+                        info = source_zip.NameToInfo.get(name)
+                    if info is not None:
+                        copy_raw_member(source_zip, info, zf)
+                    elif editor is not None and Path(name) in overlay:
+                        content = editor.dom.toxml(encoding=editor.encoding)
+                        zf.writestr(name, condense_xml_bytes(content))
+                    elif name.endswith((".xml", ".rels")):
+                        content = parts[name].read_bytes()
+                        zf.writestr(name, condense_xml_bytes(content))
+                    else:
+                        zf.write(parts[name], name)
+            os.replace(temp_file, output_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
+            if source_zip:
+                source_zip.close()
 
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
-        if not self.comments_path.exists():
+        if not self._has_part(self.comments_path):
             return 0
 
         editor = self["word/comments.xml"]
@@ -903,7 +1973,7 @@ class Document:
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._has_part(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
@@ -953,9 +2023,9 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._has_part(path):
             # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+            self._create_part_from_template("people.xml", path)
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -1069,91 +2139,202 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+        if not self._has_part(self.comments_path):
+            self._create_part_from_template("comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        # Text is set on the DOM directly, so no XML escaping is needed
+        nodes = editor.render_fragment(
+            COMMENT_TEMPLATE, id=comment_id, para_id=para_id, text=text
         )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
-  <w:p w14:paraId="{para_id}" w14:textId="77777777">
-    <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
-    <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
-  </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
+        editor.append_to(root, nodes)
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
+        if not self._has_part(self.comments_extended_path):
+            self._create_part_from_template(
+                "commentsExtended.xml", self.comments_extended_path
             )
 
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
 
         if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+            nodes = editor.render_fragment(
+                COMMENT_EX_REPLY_TEMPLATE,
+                para_id=para_id,
+                parent_para_id=parent_para_id,
+            )
         else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+            nodes = editor.render_fragment(COMMENT_EX_TEMPLATE, para_id=para_id)
+        editor.append_to(root, nodes)
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+        if not self._has_part(self.comments_ids_path):
+            self._create_part_from_template("commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        nodes = editor.render_fragment(
+            COMMENT_ID_TEMPLATE, para_id=para_id, durable_id=durable_id
+        )
+        editor.append_to(root, nodes)
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
+        if not self._has_part(self.comments_extensible_path):
+            self._create_part_from_template(
+                "commentsExtensible.xml", self.comments_extensible_path
             )
 
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        nodes = editor.render_fragment(
+            COMMENT_EXTENSIBLE_TEMPLATE, durable_id=durable_id
+        )
+        editor.append_to(root, nodes)
+
+    def _flush_pending_comments(self):
+        """Write all comments queued by add_comments() in one pass.
+
+        Range markers are inserted from compiled templates, and each comment
+        part gets a single concatenated fragment, so the cost is one parse and
+        one attribute-injection sweep per part instead of per comment.
+        """
+        pending, self._pending_comments = self._pending_comments, []
+        if not pending:
+            return
+
+        # Anchors for replies: existing comments are indexed once, queued ones
+        # are recorded as their markers are inserted
+        starts, ref_runs = {}, {}
+        if any(record["parent"] is not None for record in pending):
+            for elem in self._document.dom.getElementsByTagName("w:commentRangeStart"):
+                starts[elem.getAttribute("w:id")] = elem
+            for elem in self._document.dom.getElementsByTagName("w:commentReference"):
+                ref_runs[elem.getAttribute("w:id")] = elem.parentNode
+
+        for record in pending:
+            comment_id = record["id"]
+            parent = record["parent"]
+            if parent is None:
+                start_nodes = self._document.insert_before(
+                    record["start"], self._comment_range_start_xml(comment_id)
+                )
+                end = record["end"]
+                if end.tagName == "w:p":
+                    end_nodes = self._document.append_to(
+                        end, self._comment_range_end_xml(comment_id)
+                    )
+                else:
+                    end_nodes = self._document.insert_after(
+                        end, self._comment_range_end_xml(comment_id)
+                    )
+                ref_run = end_nodes[-1]
+            else:
+                parent_start = starts.get(str(parent))
+                parent_ref_run = ref_runs.get(str(parent))
+                if parent_start is None or parent_ref_run is None:
+                    raise ValueError(f"Range for parent comment id={parent} not found")
+                start_nodes = self._document.insert_after(
+                    parent_start, self._comment_range_start_xml(comment_id)
+                )
+                self._document.insert_after(
+                    parent_ref_run,
+                    self._document.render_fragment(
+                        COMMENT_RANGE_END_TEMPLATE, id=comment_id
+                    ),
+                )
+                ref_run = self._document.insert_after(
+                    parent_ref_run, self._comment_ref_run_xml(comment_id)
+                )[-1]
+            starts[str(comment_id)] = start_nodes[0]
+            ref_runs[str(comment_id)] = ref_run
+
+        self._ensure_comment_parts()
+        comments_xml, extended_xml, ids_xml, extensible_xml = [], [], [], []
+        for record in pending:
+            comments_xml.append(
+                COMMENT_TEMPLATE.format(
+                    id=record["id"],
+                    para_id=record["para_id"],
+                    text=html.escape(record["text"], quote=False),
+                )
+            )
+            if record["parent"] is None:
+                extended_xml.append(
+                    COMMENT_EX_TEMPLATE.format(para_id=record["para_id"])
+                )
+            else:
+                extended_xml.append(
+                    COMMENT_EX_REPLY_TEMPLATE.format(
+                        para_id=record["para_id"],
+                        parent_para_id=self.existing_comments[record["parent"]][
+                            "para_id"
+                        ],
+                    )
+                )
+            ids_xml.append(
+                COMMENT_ID_TEMPLATE.format(
+                    para_id=record["para_id"], durable_id=record["durable_id"]
+                )
+            )
+            extensible_xml.append(
+                COMMENT_EXTENSIBLE_TEMPLATE.format(durable_id=record["durable_id"])
+            )
+
+        for xml_path, root_tag, fragments in (
+            ("word/comments.xml", "w:comments", comments_xml),
+            ("word/commentsExtended.xml", "w15:commentsEx", extended_xml),
+            ("word/commentsIds.xml", "w16cid:commentsIds", ids_xml),
+            (
+                "word/commentsExtensible.xml",
+                "w16cex:commentsExtensible",
+                extensible_xml,
+            ),
+        ):
+            editor = self[xml_path]
+            editor.append_to(editor.get_node(tag=root_tag), "".join(fragments))
+
+    def _ensure_comment_parts(self):
+        """Create any missing comment part from its template."""
+        for path, template in (
+            (self.comments_path, "comments.xml"),
+            (self.comments_extended_path, "commentsExtended.xml"),
+            (self.comments_ids_path, "commentsIds.xml"),
+            (self.comments_extensible_path, "commentsExtensible.xml"),
+        ):
+            if not self._has_part(path):
+                self._create_part_from_template(template, path)
 
     # ==================== Private: XML Fragments ====================
 
     def _comment_range_start_xml(self, comment_id):
-        """Generate XML for comment range start."""
-        return f'<w:commentRangeStart w:id="{comment_id}"/>'
+        """Build nodes for comment range start."""
+        return self._document.render_fragment(
+            COMMENT_RANGE_START_TEMPLATE, id=comment_id
+        )
 
     def _comment_range_end_xml(self, comment_id):
-        """Generate XML for comment range end with reference run.
+        """Build nodes for comment range end with reference run.
 
         Note: w:rsidR is automatically added by DocxXMLEditor.
         """
-        return f'''<w:commentRangeEnd w:id="{comment_id}"/>
-<w:r>
-  <w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>
-  <w:commentReference w:id="{comment_id}"/>
-</w:r>'''
+        return self._document.render_fragment(
+            COMMENT_RANGE_END_TEMPLATE, id=comment_id
+        ) + self._comment_ref_run_xml(comment_id)
 
     def _comment_ref_run_xml(self, comment_id):
-        """Generate XML for comment reference run.
+        """Build nodes for comment reference run.
 
         Note: w:rsidR is automatically added by DocxXMLEditor.
         """
-        return f'''<w:r>
-  <w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>
-  <w:commentReference w:id="{comment_id}"/>
-</w:r>'''
+        return self._document.render_fragment(COMMENT_REF_RUN_TEMPLATE, id=comment_id)
 
     # ==================== Private: Metadata Updates ====================
 
@@ -1183,7 +2364,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._has_part(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
@@ -1274,3 +2455,245 @@ class Document:
                 f'<Override PartName="{part_name}" ContentType="{content_type}"/>'
             )
             editor.append_to(root, override_xml)
+
+
+class DocumentTransaction:
+    """Batch of edits to word/document.xml applied, validated and rolled back as one.
+
+    Nodes may be given as DOM elements or as lookup dicts with get_node()
+    keyword arguments (tag, attrs, line_number, contains). Lookups always refer
+    to the document as it was before the batch.
+    """
+
+    def __init__(self, doc: Document, validate=True):
+        self.doc = doc
+        self.validate = validate
+        self._edits = []
+        self._done = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        return False
+
+    # ==================== Recording Edits ====================
+
+    def replace(self, node, xml_content):
+        """Queue replace_node(node, xml_content)."""
+        self._edits.append(("replace_node", node, (xml_content,)))
+
+    def insert_before(self, node, xml_content):
+        """Queue insert_before(node, xml_content)."""
+        self._edits.append(("insert_before", node, (xml_content,)))
+
+    def insert_after(self, node, xml_content):
+        """Queue insert_after(node, xml_content)."""
+        self._edits.append(("insert_after", node, (xml_content,)))
+
+    def append_to(self, node, xml_content):
+        """Queue append_to(node, xml_content)."""
+        self._edits.append(("append_to", node, (xml_content,)))
+
+    def suggest_deletion(self, node):
+        """Queue suggest_deletion(node)."""
+        self._edits.append(("suggest_deletion", node, ()))
+
+    def revert_insertion(self, node):
+        """Queue revert_insertion(node)."""
+        self._edits.append(("revert_insertion", node, ()))
+
+    def revert_deletion(self, node):
+        """Queue revert_deletion(node)."""
+        self._edits.append(("revert_deletion", node, ()))
+
+    def comment(self, start, end, text):
+        """Queue a comment from start to end (see Document.add_comments)."""
+        self._edits.append(("comment", start, (end, text)))
+
+    # ==================== Applying ====================
+
+    def commit(self):
+        """Apply, validate and accept all queued edits, or roll all of them back.
+
+        Raises:
+            ValueError: If a lookup does not match exactly one node, an edit is
+                invalid, or validation fails (the document is left unchanged)
+        """
+        if self._done:
+            raise ValueError("Transaction has already been committed")
+        self._done = True
+
+        doc = self.doc
+        editor = doc._document
+        doc._flush_pending_comments()
+
+        # Lookups are resolved before anything is applied, so a lookup that
+        # fails leaves nothing to roll back
+        positions, by_tag = self._index(editor.dom)
+        edits = []
+        for order, (action, node, args) in enumerate(self._edits):
+            node = self._resolve(node, by_tag)
+            if action == "comment":
+                args = (self._resolve(args[0], by_tag), args[1])
+            edits.append(
+                (positions.get(node, len(positions)), order, action, node, args)
+            )
+        edits.sort(key=lambda edit: edit[:2])
+
+        snapshot = self._snapshot()
+        try:
+            with editor.deferred_injection():
+                for _, _, action, node, args in edits:
+                    if action == "comment":
+                        doc.add_comments([(node, args[0], args[1])])
+                    else:
+                        getattr(editor, action)(node, *args)
+                doc._flush_pending_comments()
+
+            if self.validate:
+                doc.validate()
+        except Exception:
+            self._rollback(snapshot)
+            raise
+
+    def _resolve(self, node, by_tag):
+        """Turn a lookup dict into its single matching element."""
+        if not isinstance(node, dict):
+            return node
+        tag = node["tag"]
+        candidates = by_tag.get(tag, [])
+        matches = [
+            elem for elem in candidates if _matches(self.doc._document, elem, node)
+        ]
+        if len(matches) != 1:
+            found = "No" if not matches else "Multiple"
+            raise ValueError(f"{found} nodes found for lookup {node}")
+        return matches[0]
+
+    @staticmethod
+    def _index(dom):
+        """Walk the document once, recording element order and elements by tag."""
+        positions, by_tag = {}, {}
+        stack = [dom.documentElement]
+        while stack:
+            elem = stack.pop()
+            positions[elem] = len(positions)
+            by_tag.setdefault(elem.tagName, []).append(elem)
+            stack.extend(
+                child
+                for child in reversed(elem.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
+        return positions, by_tag
+
+    # ==================== Rollback ====================
+
+    def _snapshot(self):
+        """Capture everything a batch can change."""
+        doc = self.doc
+        return {
+            "doms": {
+                path: (editor, _capture_dom(editor.dom))
+                for path, editor in doc._editors.items()
+            },
+            "overlay": doc._overlay_files(),
+            "next_comment_id": doc.next_comment_id,
+            "existing_comments": dict(doc.existing_comments),
+        }
+
+    def _rollback(self, snapshot):
+        """Restore the state captured by _snapshot()."""
+        doc = self.doc
+        # DOMs are restored in place, so element handles held by the caller
+        # still belong to the live document afterwards
+        for editor, record in snapshot["doms"].values():
+            _restore_dom(record)
+            editor._ns_decl = None
+        for path in list(doc._editors):
+            if path not in snapshot["doms"]:
+                del doc._editors[path]
+                doc._editor_sizes.pop(path, None)
+        doc._document = doc["word/document.xml"]
+        for rel in doc._overlay_files() - snapshot["overlay"]:
+            (doc.unpacked_path / rel).unlink()
+        doc.next_comment_id = snapshot["next_comment_id"]
+        doc.existing_comments = snapshot["existing_comments"]
+        doc._pending_comments = []
+        doc._save_editors()
+
+
+def _matches(editor, elem, lookup):
+    """Check an element against get_node()-style filters other than tag."""
+    line_number = lookup.get("line_number")
+    if line_number is not None:
+        elem_line = getattr(elem, "parse_position", (None,))[0]
+        if isinstance(line_number, range):
+            if elem_line not in line_number:
+                return False
+        elif elem_line != line_number:
+            return False
+    attrs = lookup.get("attrs")
+    if attrs is not None and not all(
+        elem.getAttribute(name) == value for name, value in attrs.items()
+    ):
+        return False
+    contains = lookup.get("contains")
+    if contains is not None:
+        return html.unescape(contains) in editor._get_element_text(elem)
+    return True
+
+
+def _capture_dom(dom):
+    """Record the children, attributes and text of every node in a DOM.
+
+    Unlike a deep copy, the record refers to the original nodes, so
+    _restore_dom() can put the document back together without replacing them.
+    """
+    record = []
+    stack = [dom]
+    while stack:
+        node = stack.pop()
+        if node.nodeType in (node.TEXT_NODE, node.CDATA_SECTION_NODE):
+            record.append((node, node.data, None))
+            continue
+        children = list(node.childNodes)
+        attrs = None
+        if node.nodeType == node.ELEMENT_NODE:
+            attrs = list(node.attributes.items())
+        record.append((node, children, attrs))
+        stack.extend(children)
+    return record
+
+
+def _restore_dom(record):
+    """Undo every change made to the nodes recorded by _capture_dom()."""
+    for node, state, attrs in record:
+        if node.nodeType in (node.TEXT_NODE, node.CDATA_SECTION_NODE):
+            if node.data != state:
+                node.data = state
+            continue
+
+        children = node.childNodes
+        if len(children) != len(state) or any(
+            child is not saved for child, saved in zip(children, state)
+        ):
+            children[:] = state
+            previous = None
+            for child in state:
+                child.parentNode = node
+                child.previousSibling = previous
+                child.nextSibling = None
+                if previous is not None:
+                    previous.nextSibling = child
+                previous = child
+
+        # Removed Attr nodes are unlinked by minidom, so attributes are
+        # restored by name rather than by reattaching the recorded nodes
+        if attrs is not None and list(node.attributes.items()) != attrs:
+            for name in list(node.attributes.keys()):
+                node.removeAttribute(name)
+            for name, value in attrs:
+                node.setAttribute(name, value)
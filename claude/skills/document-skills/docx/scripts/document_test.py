@@ -0,0 +1,174 @@
+import gc
+import tempfile
+import unittest
+from pathlib import Path
+from xml.parsers.expat import ExpatError
+
+from scripts.document import Document, DocxXMLEditor
+from scripts.document_text import DocumentText, read_paragraph
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Smallest unpacked tree that Document accepts, keyed by part name
+MINIMAL_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        "</Types>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>'
+    ),
+    "word/settings.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:settings xmlns:w="{W_NS}"/>'
+    ),
+}
+
+
+def create_document(test, body, **kwargs):
+    """Helper to create a Document for an unpacked tree with the given body"""
+    temp_dir = tempfile.TemporaryDirectory()
+    test.addCleanup(temp_dir.cleanup)
+    root = Path(temp_dir.name)
+    parts = dict(MINIMAL_PARTS)
+    parts["word/document.xml"] = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'
+    )
+    for name, content in parts.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(content, encoding="utf-8")
+    return Document(root, author="Tester", rsid="00AB12CD", **kwargs)
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the docx directory: python -m unittest scripts.document_test
+class TestSuggestTextChange(unittest.TestCase):
+    def create_editor(self, body):
+        """Helper to create an editor for a document.xml with the given body"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        xml_path = Path(temp_dir.name) / "document.xml"
+        xml_path.write_text(
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>',
+            encoding="utf-8",
+        )
+        return DocxXMLEditor(xml_path, rsid="00AB12CD", author="Tester")
+
+    def texts(self, editor, tag):
+        """Helper to collect the text of all w:t or w:delText elements"""
+        return [
+            "".join(child.data for child in elem.childNodes)
+            for elem in editor.dom.getElementsByTagName(tag)
+            if not (tag == "w:t" and elem.parentNode.parentNode.tagName == "w:del")
+        ]
+
+    def test_line_break_is_kept_in_paragraph(self):
+        """Test that a w:br inside the paragraph is not treated as a new paragraph"""
+        editor = self.create_editor(
+            "<w:p><w:r><w:t>Line one</w:t><w:br/>"
+            '<w:t xml:space="preserve">line two Seller</w:t></w:r></w:p>'
+        )
+        paragraph = editor.dom.getElementsByTagName("w:p")[0]
+        self.assertEqual(read_paragraph(paragraph)[0], "Line one\nline two Seller")
+
+        editor.suggest_text_change(paragraph, "Line one\nline two Vendor")
+
+        self.assertEqual(len(editor.dom.getElementsByTagName("w:p")), 1)
+        self.assertEqual(self.texts(editor, "w:delText"), ["Seller"])
+        inserted = [
+            "".join(t.firstChild.data for t in ins.getElementsByTagName("w:t"))
+            for ins in editor.dom.getElementsByTagName("w:ins")
+        ]
+        self.assertEqual(inserted, ["Vendor"])
+        # The line break stays in place, outside any tracked change
+        breaks = editor.dom.getElementsByTagName("w:br")
+        self.assertEqual(len(breaks), 1)
+        self.assertEqual(breaks[0].parentNode.parentNode.tagName, "w:p")
+
+    def test_range_with_paragraph_texts(self):
+        """Test rewriting a range from doc.text-style paragraph texts"""
+        editor = self.create_editor(
+            "<w:p><w:r><w:t>The Seller agrees.</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>Signed:</w:t><w:br/><w:t>Seller</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>Unchanged.</w:t></w:r></w:p>"
+        )
+        text = DocumentText(editor)
+        self.assertEqual(
+            text.paragraph_texts,
+            ["The Seller agrees.", "Signed:\nSeller", "Unchanged."],
+        )
+        paragraphs = text.paragraphs
+        new_texts = [t.replace("Seller", "Vendor") for t in text.paragraph_texts]
+
+        editor.suggest_text_change(paragraphs[0], new_texts, end=paragraphs[-1])
+
+        self.assertEqual(len(editor.dom.getElementsByTagName("w:p")), 3)
+        self.assertEqual(self.texts(editor, "w:delText"), ["Seller", "Seller"])
+        self.assertEqual(
+            text.paragraph_texts,
+            ["The Vendor agrees.", "Signed:\nVendor", "Unchanged."],
+        )
+
+    def test_range_requires_list(self):
+        """Test that a single string is rejected for a range of paragraphs"""
+        editor = self.create_editor(
+            "<w:p><w:r><w:t>One</w:t></w:r></w:p><w:p><w:r><w:t>Two</w:t></w:r></w:p>"
+        )
+        first, last = editor.dom.getElementsByTagName("w:p")
+        with self.assertRaises(ValueError):
+            editor.suggest_text_change(first, "One\nTwo", end=last)
+
+
+class TestTransaction(unittest.TestCase):
+    def test_failed_batch_with_deletion_is_rolled_back(self):
+        """Test that a failed batch restores attributes removed by suggest_deletion"""
+        doc = create_document(
+            self,
+            '<w:p w:rsidR="00112233"><w:r w:rsidR="00112233"><w:t>First</w:t></w:r></w:p>'
+            '<w:p w:rsidR="00445566"><w:r w:rsidR="00445566"><w:t>Second</w:t></w:r></w:p>',
+        )
+        editor = doc["word/document.xml"]
+        first, second = editor.dom.getElementsByTagName("w:r")
+        before = editor.dom.toxml()
+
+        # The malformed replacement fails after the deletion has been applied
+        with self.assertRaises(ExpatError):
+            with doc.transaction(validate=False) as tx:
+                tx.suggest_deletion(first)
+                tx.replace(second, "<w:r><w:t>Unclosed</w:r>")
+
+        self.assertEqual(doc["word/document.xml"].dom.toxml(), before)
+        # The caller's handles still belong to the restored document
+        self.assertIs(
+            first.parentNode.parentNode.parentNode, editor.dom.documentElement
+        )
+
+
+class TestEditorEviction(unittest.TestCase):
+    def test_edit_through_held_node_survives_eviction(self):
+        """Test that a node held across an eviction still edits the saved part"""
+        doc = create_document(
+            self, "<w:p><w:r><w:t>Body</w:t></w:r></w:p>", editor_memory_budget=1
+        )
+        settings = doc["word/settings.xml"].get_node(tag="w:settings")
+        # Opening another part evicts word/settings.xml
+        doc["word/people.xml"]
+        self.assertNotIn("word/settings.xml", doc._editors)
+        gc.collect()
+
+        doc["word/settings.xml"].append_to(settings, "<w:evenAndOddHeaders/>")
+        doc["word/people.xml"]
+        gc.collect()
+        doc.save(validate=False)
+
+        saved = (doc.original_path / "word/settings.xml").read_text(encoding="utf-8")
+        self.assertIn("w:evenAndOddHeaders", saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Text model for word/document.xml that maps text offsets back to the DOM.
+
+DocumentText flattens the visible text of every paragraph (w:t content, with
+w:tab as a tab and w:br/w:cr as a newline; deleted text is excluded) into one
+string, with paragraphs separated by a newline. Every offset in that string can
+be resolved to its paragraph, run and character, so a text search or regex
+match leads straight to the nodes that suggest_deletion, add_comment and
+similar methods need, even when the text is split across runs.
+
+The model is built in one pass and kept up to date per paragraph: edits made
+through the DocxXMLEditor only cause the touched paragraphs to be re-read.
+
+Example usage:
+    text = doc.text
+
+    span = text.find("Effective Date")
+    span = next(text.finditer(r"\\$[0-9,]+"))
+    paragraph, run, elem, char = text.locate(span.start)
+
+    # Split runs at the span boundaries and get exactly the covering runs
+    runs = text.select_runs(span)
+    for run in runs:
+        doc["word/document.xml"].suggest_deletion(run)
+    doc.add_comment(start=runs[0], end=runs[-1], text="Removed")
+"""
+
+import bisect
+import re
+
+# Separator placed between paragraphs in the flattened text
+PARAGRAPH_SEPARATOR = "\n"
+
+# Characters produced by non-text run content
+SPECIAL_CHARACTERS = {"w:tab": "\t", "w:br": "\n", "w:cr": "\n"}
+
+# Subtrees that never contribute visible text
+SKIPPED_TAGS = {"w:pPr", "w:rPr", "w:delText", "w:instrText", "w:p"}
+
+
+class TextSpan:
+    """
+    A range [start, end) of the flattened document text.
+
+    Attributes:
+        start: Offset of the first character
+        end: Offset just past the last character
+    """
+
+    def __init__(self, model, start, end):
+        self.model = model
+        self.start = start
+        self.end = end
+
+    @property
+    def text(self):
+        """The text covered by the span."""
+        return self.model.value[self.start : self.end]
+
+    @property
+    def paragraphs(self):
+        """w:p elements overlapping the span, in document order."""
+        return self.model.paragraphs_in(self.start, self.end)
+
+    @property
+    def runs(self):
+        """w:r elements overlapping the span (runs are not split)."""
+        return self.model.runs_in(self.start, self.end)
+
+    def __repr__(self):
+        return f"TextSpan({self.start}, {self.end}, {self.text!r})"
+
+
+class DocumentText:
+    """
+    Flattened text of a document part with an offset-to-DOM map.
+
+    Attributes:
+        editor: DocxXMLEditor for the part (normally word/document.xml)
+    """
+
+    def __init__(self, editor):
+        """
+        Build the model for an editor and subscribe to its edits.
+
+        Args:
+            editor: DocxXMLEditor whose text should be modelled
+        """
+        self.editor = editor
+        self._dom = None
+        self._paragraphs = []
+        # Paragraph element -> (text, [(start, end, run, elem), ...])
+        self._segments = {}
+        self._dirty = set()
+        self._structure_dirty = True
+        self._value = None
+        self._starts = []
+        editor.add_change_listener(self._on_change)
+
+    # ==================== Queries ====================
+
+    @property
+    def value(self) -> str:
+        """The flattened text of the whole part."""
+        self._refresh()
+        return self._value
+
+    def __str__(self):
+        return self.value
+
+    @property
+    def paragraphs(self):
+        """All w:p elements of the part, in document order."""
+        self._refresh()
+        return list(self._paragraphs)
+
+    @property
+    def paragraph_texts(self):
+        """The text of each paragraph in paragraphs.
+
+        Unlike splitting value on newlines, this keeps paragraphs with w:br or
+        w:cr line breaks in one piece.
+        """
+        self._refresh()
+        return [self._segments[paragraph][0] for paragraph in self._paragraphs]
+
+    def find(self, substring, start=0):
+        """
+        Find the first occurrence of substring at or after offset start.
+
+        Returns:
+            TextSpan, or None if the substring does not occur
+        """
+        index = self.value.find(substring, start)
+        if index < 0:
+            return None
+        return TextSpan(self, index, index + len(substring))
+
+    def find_all(self, substring):
+        """Return a TextSpan for every non-overlapping occurrence of substring."""
+        return list(self.finditer(re.escape(substring)))
+
+    def finditer(self, pattern, flags=0):
+        """
+        Yield a TextSpan for every match of a regular expression.
+
+        Args:
+            pattern: Regular expression (str or compiled pattern)
+            flags: re flags, used when pattern is a string
+        """
+        regex = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        for match in regex.finditer(self.value):
+            yield TextSpan(self, match.start(), match.end())
+
+    def span(self, start, end):
+        """Return the TextSpan [start, end)."""
+        if not 0 <= start <= end <= len(self.value):
+            raise ValueError(f"Span {start}-{end} is outside the document text")
+        return TextSpan(self, start, end)
+
+    def locate(self, offset):
+        """
+        Resolve a text offset to the DOM.
+
+        Args:
+            offset: Offset into value
+
+        Returns:
+            tuple: (paragraph, run, elem, char) where elem is the w:t (or w:tab,
+            w:br, w:cr) holding the character and char is its index within elem.
+            run and elem are None for a paragraph separator.
+
+        Raises:
+            ValueError: If offset is outside the text
+        """
+        self._refresh()
+        if not 0 <= offset < len(self._value):
+            raise ValueError(f"Offset {offset} is outside the document text")
+        index = bisect.bisect_right(self._starts, offset) - 1
+        paragraph = self._paragraphs[index]
+        local = offset - self._starts[index]
+        for start, end, run, elem in self._segments[paragraph][1]:
+            if start <= local < end:
+                return paragraph, run, elem, local - start
+        return paragraph, None, None, None
+
+    def paragraphs_in(self, start, end):
+        """w:p elements overlapping [start, end), in document order."""
+        self._refresh()
+        first = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        last = bisect.bisect_left(self._starts, max(end, start + 1))
+        return self._paragraphs[first:last]
+
+    def runs_in(self, start, end):
+        """w:r elements with text overlapping [start, end), in document order."""
+        runs = []
+        for paragraph_start, paragraph in self._paragraph_offsets(start, end):
+            for seg_start, seg_end, run, _ in self._segments[paragraph][1]:
+                if (
+                    seg_start + paragraph_start < end
+                    and seg_end + paragraph_start > start
+                    and run is not None
+                    and (not runs or runs[-1] is not run)
+                ):
+                    runs.append(run)
+        return runs
+
+    def select_runs(self, span):
+        """
+        Split runs at the span boundaries and return the runs covering it.
+
+        Runs are split by cloning them (keeping w:rPr) and dividing the w:t
+        text, so formatting is preserved and the returned runs cover exactly
+        the span's text. The model is updated for the split paragraphs.
+
+        Args:
+            span: TextSpan (or (start, end) tuple) to isolate
+
+        Returns:
+            List of w:r elements in document order
+
+        Example:
+            runs = doc.text.select_runs(doc.text.find("net 30"))
+            for run in runs:
+                doc["word/document.xml"].suggest_deletion(run)
+        """
+        start, end = (span.start, span.end) if isinstance(span, TextSpan) else span
+        if start >= end:
+            return []
+        # Split at the end first so the offset of the start boundary is unchanged
+        self._split_at(end)
+        self._split_at(start)
+        return self.runs_in(start, end)
+
+    # ==================== Private: Model Maintenance ====================
+
+    def _on_change(self, nodes):
+        """Mark the paragraphs touched by an edit as stale."""
+        for node in nodes:
+            if node.nodeType != node.ELEMENT_NODE:
+                node = node.parentNode
+                if node is None:
+                    continue
+            if node.tagName == "w:p" or node.getElementsByTagName("w:p"):
+                self._structure_dirty = True
+            paragraph = _enclosing_paragraph(node)
+            if paragraph is None:
+                self._structure_dirty = True
+            else:
+                self._dirty.add(paragraph)
+            self._value = None
+
+    def _refresh(self):
+        """Re-read stale paragraphs and rebuild offsets if anything changed."""
+        dom = self.editor.dom
+        if dom is not self._dom:
+            self._dom = dom
+            self._segments = {}
+            self._structure_dirty = True
+        if self._structure_dirty:
+            self._paragraphs = list(dom.getElementsByTagName("w:p"))
+            alive = set(self._paragraphs)
+            self._segments = {
+                p: entry for p, entry in self._segments.items() if p in alive
+            }
+            self._structure_dirty = False
+            self._value = None
+        for paragraph in self._dirty:
+            self._segments.pop(paragraph, None)
+        self._dirty.clear()
+        if self._value is not None:
+            return
+
+        texts, starts, offset = [], [], 0
+        for paragraph in self._paragraphs:
+            entry = self._segments.get(paragraph)
+            if entry is None:
+                entry = self._segments[paragraph] = read_paragraph(paragraph)
+            starts.append(offset)
+            texts.append(entry[0])
+            offset += len(entry[0]) + len(PARAGRAPH_SEPARATOR)
+        self._starts = starts
+        self._value = PARAGRAPH_SEPARATOR.join(texts)
+
+    def _paragraph_offsets(self, start, end):
+        """(paragraph start offset, paragraph) pairs overlapping [start, end)."""
+        self._refresh()
+        first = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        last = bisect.bisect_left(self._starts, max(end, start + 1))
+        return list(zip(self._starts[first:last], self._paragraphs[first:last]))
+
+    def _split_at(self, offset):
+        """Split the run containing offset so that a run boundary falls on it."""
+        if offset >= len(self.value):
+            return
+        paragraph, run, elem, char = self.locate(offset)
+        if run is None or (char and elem.tagName != "w:t"):
+            return
+        if split_run(run, elem, char) is not None:
+            self._dirty.add(paragraph)
+            self._value = None
+
+
+def _enclosing_paragraph(node):
+    """Return node if it is a w:p, else its nearest w:p ancestor (or None)."""
+    while node is not None and node.nodeType == node.ELEMENT_NODE:
+        if node.tagName == "w:p":
+            return node
+        node = node.parentNode
+    return None
+
+
+def _node_text(elem):
+    """Concatenate the text node children of an element, whitespace included."""
+    return "".join(
+        child.data for child in elem.childNodes if child.nodeType == child.TEXT_NODE
+    )
+
+
+def _set_text(elem, text):
+    """Replace the text of a w:t, keeping xml:space in step with the content."""
+    for child in list(elem.childNodes):
+        elem.removeChild(child)
+    elem.appendChild(elem.ownerDocument.createTextNode(text))
+    if text and (text[0].isspace() or text[-1].isspace()):
+        elem.setAttribute("xml:space", "preserve")
+
+
+def read_paragraph(paragraph):
+    """Return (text, segments) for one paragraph, skipping nested paragraphs."""
+    pieces, segments, offset = [], [], 0
+    stack = list(reversed(paragraph.childNodes))
+    while stack:
+        node = stack.pop()
+        if node.nodeType != node.ELEMENT_NODE or node.tagName in SKIPPED_TAGS:
+            continue
+        if node.tagName == "w:t":
+            text = _node_text(node)
+        elif node.tagName in SPECIAL_CHARACTERS:
+            text = SPECIAL_CHARACTERS[node.tagName]
+        else:
+            stack.extend(reversed(node.childNodes))
+            continue
+        if text:
+            run = node.parentNode
+            if run is not None and run.tagName != "w:r":
+                run = None
+            segments.append((offset, offset + len(text), run, node))
+            pieces.append(text)
+            offset += len(text)
+    return "".join(pieces), segments
+
+
+def split_run(run, t_elem, char):
+    """Split a run before character char of its child t_elem.
+
+    The original run keeps everything up to the split point, and a clone
+    inserted after it (with the same w:rPr) receives the rest. With char 0
+    the split falls right before t_elem, which may then also be a w:tab, w:br
+    or w:cr; if nothing precedes it in the run, the run is left as it is and
+    None is returned.
+    """
+    children = list(run.childNodes)
+    index = children.index(t_elem)
+    if char == 0 and not any(
+        child.nodeType == child.ELEMENT_NODE and child.tagName != "w:rPr"
+        for child in children[:index]
+    ):
+        return None
+    clone = run.cloneNode(True)
+    clone_children = list(clone.childNodes)
+
+    for child in children[index + 1 if char else index :]:
+        run.removeChild(child)
+    for child in clone_children[:index]:
+        if child.nodeType == child.ELEMENT_NODE and child.tagName == "w:rPr":
+            continue
+        clone.removeChild(child)
+
+    if char:
+        text = _node_text(t_elem)
+        _set_text(t_elem, text[:char])
+        _set_text(clone_children[index], text[char:])
+    run.parentNode.insertBefore(clone, run.nextSibling)
+    return clone
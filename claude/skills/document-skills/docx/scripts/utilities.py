@@ -26,17 +26,29 @@ Example usage:
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
 
+    # Insert repeated, parameterized markup from a compiled template
+    nodes = editor.render_fragment('<w:commentRangeStart w:id="{id}"/>', id=5)
+    editor.insert_before(elem, nodes)
+
     # Save changes
     editor.save()
 """
 
+import bisect
 import html
+import string
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
 
+# Maximum number of parsed fragments and compiled templates kept per editor
+FRAGMENT_CACHE_SIZE = 256
+# Fragments longer than this (e.g. bulk inserts) are parsed but never cached
+FRAGMENT_CACHE_MAX_LENGTH = 4096
+
 
 class XMLEditor:
     """
@@ -73,6 +85,16 @@ class XMLEditor:
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
+        # Namespace context and parsed fragment prototypes (see _parse_fragment)
+        self._ns_decl = None
+        self._ns_decl_key = None
+        self._fragment_cache = OrderedDict()
+        self._template_cache = OrderedDict()
+
+        # Per-tag elements sorted by original line number (see _line_candidates)
+        self._line_index = {}
+        self._line_index_dom = None
+
     def get_node(
         self,
         tag: str,
@@ -110,7 +132,11 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        if line_number is not None:
+            candidates = self._line_candidates(tag, line_number)
+        else:
+            candidates = self.dom.getElementsByTagName(tag)
+        for elem in candidates:
             # Check line_number filter
             if line_number is not None:
                 parse_pos = getattr(elem, "parse_position", (None,))
@@ -180,6 +206,60 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _line_candidates(self, tag, line_number):
+        """
+        Return elements with the given tag whose original line may match.
+
+        Uses a per-tag index of (line, element) pairs sorted by parse_position,
+        built on first use, so a line or range lookup is a binary search rather
+        than a scan. Inserted nodes have no original line and never match, and
+        nodes that have since been removed from the document are skipped.
+
+        Args:
+            tag: The XML tag name
+            line_number: Line number (int) or line range (range)
+
+        Returns:
+            List of attached elements in line order (filters still apply)
+        """
+        if self._line_index_dom is not self.dom:
+            self._line_index = {}
+            self._line_index_dom = self.dom
+        index = self._line_index.get(tag)
+        if index is None:
+            entries = sorted(
+                (
+                    (elem.parse_position[0], i, elem)
+                    for i, elem in enumerate(self.dom.getElementsByTagName(tag))
+                    if hasattr(elem, "parse_position")
+                ),
+                key=lambda entry: entry[:2],
+            )
+            index = self._line_index[tag] = (
+                [line for line, _, _ in entries],
+                [elem for _, _, elem in entries],
+            )
+        lines, elems = index
+
+        if isinstance(line_number, range):
+            if not line_number:
+                return []
+            low, high = min(line_number), max(line_number)
+        else:
+            low = high = line_number
+        start = bisect.bisect_left(lines, low)
+        stop = bisect.bisect_right(lines, high)
+        return [elem for elem in elems[start:stop] if self._is_attached(elem)]
+
+    def _is_attached(self, elem):
+        """Check whether an element is still part of this editor's document."""
+        node = elem
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -209,7 +289,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to replace
-            new_content: String containing XML to replace the node with
+            new_content: String containing XML to replace the node with, or a
+                list of nodes returned by render_fragment()
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -230,7 +311,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to insert after
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert, or a list of nodes
+                returned by render_fragment()
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -254,7 +336,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to insert before
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert, or a list of nodes
+                returned by render_fragment()
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -274,7 +357,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to append to
-            xml_content: String containing XML to append
+            xml_content: String containing XML to append, or a list of nodes
+                returned by render_fragment()
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -309,40 +393,158 @@ class XMLEditor:
         content = self.dom.toxml(encoding=self.encoding)
         self.xml_path.write_bytes(content)
 
-    def _parse_fragment(self, xml_content):
+    def render_fragment(self, template, **values):
         """
-        Parse XML fragment and return list of imported nodes.
+        Build nodes from a parameterized XML template without re-parsing it.
+
+        The template uses str.format-style placeholders ({name}) in attribute
+        values and text content. It is parsed once per editor into a prototype;
+        each call clones the prototype and fills in the placeholders, so values
+        are inserted as raw text and must not be XML-escaped by the caller.
 
         Args:
-            xml_content: String containing XML fragment
+            template: XML fragment string with {name} placeholders
+            **values: Values for each placeholder (converted with str())
 
         Returns:
-            List of defusedxml.minidom.Node objects imported into this document
+            List[defusedxml.minidom.Node]: Nodes owned by this document, ready
+            to pass to insert_before, insert_after, append_to or replace_node
 
         Raises:
-            AssertionError: If fragment contains no element nodes
+            KeyError: If a placeholder has no value
+
+        Example:
+            nodes = editor.render_fragment(
+                '<w:r><w:t>{text}</w:t></w:r>', text="5 < 6 & 7"
+            )
+            editor.append_to(para, nodes)
+        """
+        compiled = self._template_cache.get(template)
+        if compiled is None:
+            compiled = _FragmentTemplate(template, self._parse_fragment)
+            self._template_cache[template] = compiled
+            if len(self._template_cache) > FRAGMENT_CACHE_SIZE:
+                self._template_cache.popitem(last=False)
+        else:
+            self._template_cache.move_to_end(template)
+        return compiled.render(values)
+
+    def _namespace_declarations(self):
+        """Return the xmlns declarations of the root element as a string.
+
+        Computed once and reused until the root element's attributes change
+        (e.g. when a namespace is added for new content).
         """
-        # Extract namespace declarations from the root document element
         root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
+        attributes = root_elem.attributes if root_elem else None
+        key = attributes.length if attributes else 0
+        if self._ns_decl is None or key != self._ns_decl_key:
+            namespaces = []
+            for i in range(key):
+                attr = attributes.item(i)  # type: ignore
                 if attr.name.startswith("xmlns"):  # type: ignore
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._ns_decl = " ".join(namespaces)
+            self._ns_decl_key = key
+        return self._ns_decl
 
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
+    def _parse_fragment(self, xml_content):
+        """
+        Parse XML fragment and return list of imported nodes.
+
+        Parsed fragments are cached per editor, so inserting identical markup
+        repeatedly only clones the cached prototype nodes.
+
+        Args:
+            xml_content: String containing XML fragment, or a list of nodes
+                already owned by this document (returned as-is)
+
+        Returns:
+            List of defusedxml.minidom.Node objects imported into this document
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        if not isinstance(xml_content, str):
+            nodes = list(xml_content)
+        else:
+            prototypes = self._fragment_cache.get(xml_content)
+            if prototypes is None:
+                wrapper = f"<root {self._namespace_declarations()}>{xml_content}</root>"
+                fragment_doc = defusedxml.minidom.parseString(wrapper)
+                prototypes = [
+                    self.dom.importNode(child, deep=True)
+                    for child in fragment_doc.documentElement.childNodes  # type: ignore
+                ]
+                if len(xml_content) > FRAGMENT_CACHE_MAX_LENGTH:
+                    nodes = prototypes
+                else:
+                    self._fragment_cache[xml_content] = prototypes
+                    if len(self._fragment_cache) > FRAGMENT_CACHE_SIZE:
+                        self._fragment_cache.popitem(last=False)
+                    nodes = [node.cloneNode(True) for node in prototypes]
+            else:
+                self._fragment_cache.move_to_end(xml_content)
+                nodes = [node.cloneNode(True) for node in prototypes]
         elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
         assert elements, "Fragment must contain at least one element"
         return nodes
 
 
+class _FragmentTemplate:
+    """
+    Parsed prototype of an XML fragment with {name} placeholders.
+
+    Placeholders are replaced by unique tokens before parsing, and the location
+    of every attribute or text node containing a token is recorded as a path of
+    child indices, so rendering is a clone plus a few direct assignments.
+    """
+
+    _TOKEN = "__fragment_slot_{}__"
+
+    def __init__(self, template, parse):
+        names = {
+            field for _, field, _, _ in string.Formatter().parse(template) if field
+        }
+        self.tokens = {name: self._TOKEN.format(name) for name in names}
+        self.prototypes = parse(template.format(**self.tokens))
+        self.slots = []
+        for index, node in enumerate(self.prototypes):
+            self._collect_slots(node, (index,))
+
+    def _collect_slots(self, node, path):
+        if node.nodeType == node.TEXT_NODE:
+            if "__fragment_slot_" in node.data:
+                self.slots.append((path, None, node.data))
+            return
+        if node.nodeType != node.ELEMENT_NODE:
+            return
+        for i in range(node.attributes.length):
+            attr = node.attributes.item(i)
+            if "__fragment_slot_" in attr.value:
+                self.slots.append((path, attr.name, attr.value))
+        for index, child in enumerate(node.childNodes):
+            self._collect_slots(child, path + (index,))
+
+    def render(self, values):
+        missing = self.tokens.keys() - values.keys()
+        if missing:
+            raise KeyError(f"Missing template values: {sorted(missing)}")
+        nodes = [node.cloneNode(True) for node in self.prototypes]
+        for path, attr_name, raw in self.slots:
+            target = nodes[path[0]]
+            for index in path[1:]:
+                target = target.childNodes[index]
+            filled = raw
+            for name, token in self.tokens.items():
+                filled = filled.replace(token, str(values[name]))
+            if attr_name is None:
+                target.data = filled
+            else:
+                target.setAttribute(attr_name, filled)
+        return nodes
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
@@ -3,17 +3,43 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--jobs N] [--original FILE]
 """
 
 import argparse
+import atexit
+import copy
+import io
+import json
+import os
+import queue
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import threading
+import time
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.sax.handler import ContentHandler, property_lexical_handler
+
+import defusedxml.sax
+
+# Manifest of a partially unpacked tree (written by unpack.py --parts/--lazy)
+PACKAGE_MANIFEST = ".ooxml-package.json"
+
+# Below this much XML, condensing in-process beats starting worker processes
+MIN_PARALLEL_BYTES = 256 * 1024
+
+# Compression per file extension; anything not listed is deflated. Media that is
+# already compressed gains nothing from deflate, so it is stored.
+COMPRESSION_BY_EXTENSION = {
+    ext: zipfile.ZIP_STORED
+    for ext in (".jpeg", ".jpg", ".png", ".gif", ".wdp", ".mp3", ".m4a", ".mp4", ".m4v")
+}
 
 
 def main():
@@ -21,11 +47,26 @@ def main():
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--original",
+        default=None,
+        help="Original Office file; unchanged members are copied from it as is",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            jobs=args.jobs,
+            original=args.original,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +83,29 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir, output_file, validate=False, jobs=None, original=None, compression=None
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    XML parts are condensed while being streamed into the archive, without a
+    temporary copy of the tree; condensing and compressing them is spread over
+    a process pool. If the directory was only partly unpacked, parts that are
+    not on disk are copied unchanged from the original file recorded in its
+    manifest.
+
+    Given the original archive (or for a partly unpacked tree, its source),
+    members whose packed bytes are identical to the original's are copied as
+    raw compressed data, so untouched media is never inflated or deflated.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        jobs: Number of worker processes (default: number of CPUs)
+        original: Optional original Office file to copy unchanged members from
+        compression: Optional {extension: zipfile.ZIP_STORED/ZIP_DEFLATED}
+            overriding COMPRESSION_BY_EXTENSION
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +118,158 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    policy = {**COMPRESSION_BY_EXTENSION, **(compression or {})}
+    source, removed = read_manifest(input_dir)
+    reference_file = original or source
+    reference = zipfile.ZipFile(reference_file) if reference_file else None
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    try:
+        files = [
+            f
+            for f in input_dir.rglob("*")
+            if f.is_file() and f.name != PACKAGE_MANIFEST
+        ]
+        arcnames = {f: f.relative_to(input_dir).as_posix() for f in files}
+        xml_tasks = [
+            (
+                f,
+                _compress_type(f, policy),
+                _reference_fingerprint(reference, arcnames[f]),
+            )
+            for f in files
+            if f.name.endswith((".xml", ".rels"))
+        ]
+        compressed = _compress_parts(xml_tasks, jobs)
+        xml_files = {task[0] for task in xml_tasks}
 
         # Create final Office file as zip archive
         output_file.parent.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
+            written = set()
+            for f in files:
+                arcname = arcnames[f]
+                written.add(arcname)
+                if f in xml_files:
+                    crc, size, data = next(compressed)
+                    if data is None:
+                        # Same bytes as the reference member
+                        copy_raw_member(reference, reference.getinfo(arcname), zf)
+                        continue
+                    info = zipfile.ZipInfo.from_file(f, arcname)
+                    info.compress_type = _compress_type(f, policy)
+                    info.CRC, info.file_size = crc, size
+                    info.compress_size = len(data)
+                    write_raw_member(zf, info, data)
+                elif _matches_reference(f, reference, arcname):
+                    copy_raw_member(reference, reference.getinfo(arcname), zf)
+                else:
+                    zf.write(f, arcname, compress_type=_compress_type(f, policy))
 
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            # Parts that were never unpacked come straight from the original
+            if source is not None:
+                with zipfile.ZipFile(source) as source_zip:
+                    for info in source_zip.infolist():
+                        if (
+                            not info.is_dir()
+                            and info.filename not in written
+                            and info.filename not in removed
+                        ):
+                            copy_raw_member(source_zip, info, zf)
+    finally:
+        if reference is not None:
+            reference.close()
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def _compress_type(path, policy):
+    return policy.get(path.suffix.lower(), zipfile.ZIP_DEFLATED)
+
+
+def _reference_fingerprint(reference, arcname):
+    """(CRC, size) of a member of the reference archive, or None."""
+    if reference is None or arcname not in reference.NameToInfo:
+        return None
+    info = reference.getinfo(arcname)
+    return info.CRC, info.file_size
+
+
+def _matches_reference(path, reference, arcname):
+    """True if a file has the same size and CRC-32 as the reference member."""
+    fingerprint = _reference_fingerprint(reference, arcname)
+    if fingerprint is None or path.stat().st_size != fingerprint[1]:
+        return False
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            crc = zlib.crc32(chunk, crc)
+    return crc == fingerprint[0]
+
+
+def _compress_parts(xml_tasks, jobs):
+    """Condense and compress XML files, in parallel when it pays off.
+
+    Returns:
+        iterator: (crc, size, compressed bytes) per task, in the order given;
+        the bytes are None when the part matches its reference fingerprint
+    """
+    jobs = jobs or os.cpu_count() or 1
+    total = sum(task[0].stat().st_size for task in xml_tasks)
+    if jobs <= 1 or len(xml_tasks) <= 1 or total < MIN_PARALLEL_BYTES:
+        return map(_condense_and_compress, xml_tasks)
+    return _compress_in_pool(xml_tasks, jobs)
+
+
+def _compress_in_pool(xml_tasks, jobs):
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunksize = max(1, len(xml_tasks) // (jobs * 4))
+        yield from executor.map(_condense_and_compress, xml_tasks, chunksize=chunksize)
+
+
+def _condense_and_compress(task):
+    """Return (crc, size, compressed data) of a condensed XML file.
+
+    The data is None if the condensed bytes match the reference fingerprint.
+    """
+    xml_file, compress_type, fingerprint = task
+    buffer = io.BytesIO()
+    with open(xml_file, "rb") as source:
+        condense_xml_stream(source, buffer)
+    content = buffer.getvalue()
+    crc = zlib.crc32(content)
+    if fingerprint == (crc, len(content)):
+        return crc, len(content), None
+    if compress_type == zipfile.ZIP_STORED:
+        return crc, len(content), content
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return crc, len(content), compressor.compress(content) + compressor.flush()
+
+
+def read_manifest(input_dir):
+    """Return (source archive, removed part names) of a partially unpacked tree.
+
+    For a fully unpacked directory this is (None, empty set).
+    """
+    manifest = Path(input_dir) / PACKAGE_MANIFEST
+    if not manifest.exists():
+        return None, set()
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    return Path(data["source"]), set(data.get("removed", []))
+
+
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with soffice.
+
+    The conversion runs on a warm instance from the office pool when
+    LibreOffice's Python bridge is available, so the timeout only covers the
+    conversion and not LibreOffice's startup.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,29 +281,12 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            convert_document(doc_path, filter_name, temp_dir, timeout=10)
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -130,29 +294,462 @@ def validate_document(doc_path):
             return False
 
 
+def convert_document(doc_path, target, outdir, timeout=None):
+    """Convert a document with LibreOffice, like soffice --convert-to.
+
+    Args:
+        doc_path: Document to convert
+        target: Target as for --convert-to, e.g. "pdf" or "html:HTML"
+        outdir: Directory for the converted file
+        timeout: Seconds allowed for the conversion itself
+
+    Returns:
+        Path: The converted file (outdir/<stem>.<extension>)
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        TimeoutError: If the conversion takes longer than timeout
+        RuntimeError: If LibreOffice could not convert the document
+    """
+    doc_path = Path(doc_path).resolve()
+    extension, _, filter_name = target.partition(":")
+    filter_name = filter_name or EXPORT_FILTERS.get(
+        (extension, doc_path.suffix.lower())
+    )
+    output = Path(outdir).resolve() / f"{doc_path.stem}.{extension}"
+
+    pool = get_office_pool() if filter_name else None
+    if pool is not None:
+        pool.convert(doc_path, output, filter_name, timeout)
+        return output
+
+    try:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                target,
+                "--outdir",
+                str(output.parent),
+                str(doc_path),
+            ],
+            capture_output=True,
+            timeout=timeout,
+            text=True,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise TimeoutError(f"Conversion of {doc_path.name} timed out") from e
+    if not output.exists():
+        raise RuntimeError(result.stderr.strip() or "Document validation failed")
+    return output
+
+
+# Filters for --convert-to targets given without one, by (extension, source type)
+EXPORT_FILTERS = {
+    ("pdf", ".docx"): "writer_pdf_Export",
+    ("pdf", ".pptx"): "impress_pdf_Export",
+    ("pdf", ".xlsx"): "calc_pdf_Export",
+}
+
+# Number of LibreOffice instances kept running for conversions
+OFFICE_POOL_SIZE = int(os.environ.get("OOXML_OFFICE_POOL_SIZE", "2"))
+
+# Seconds an instance gets to start up and accept connections
+OFFICE_START_TIMEOUT = 60
+
+_office_pool = None
+
+
+def get_office_pool():
+    """Return the shared office pool, or None if it cannot be used.
+
+    The pool needs soffice on the PATH and LibreOffice's Python bridge (uno);
+    without them conversions fall back to one soffice process per file.
+    """
+    global _office_pool
+    if _office_pool is None:
+        if shutil.which("soffice") is None:
+            return None
+        try:
+            import uno  # noqa: F401
+        except ImportError:
+            return None
+        _office_pool = OfficePool(OFFICE_POOL_SIZE)
+        atexit.register(_office_pool.close)
+    return _office_pool
+
+
+class OfficePool:
+    """
+    Long-lived headless LibreOffice instances for conversions.
+
+    Each instance has its own user profile (-env:UserInstallation) and listens
+    on its own local pipe, driven over UNO. Instances start on first use, are
+    health-checked before every conversion and restarted if they crashed or
+    hung. Conversions from several threads run on different instances, so
+    throughput grows with the pool size.
+
+    Example:
+        pool = OfficePool(4)
+        pool.convert("deck.pptx", "/tmp/out/deck.pdf", "impress_pdf_Export")
+        pool.close()
+    """
+
+    def __init__(self, size):
+        """
+        Create a pool; no LibreOffice process is started until needed.
+
+        Args:
+            size: Number of instances
+        """
+        self.root = Path(tempfile.mkdtemp(prefix="ooxml-office-"))
+        self.instances = [_OfficeInstance(self.root, i) for i in range(size)]
+        self.idle = queue.Queue()
+        for instance in self.instances:
+            self.idle.put(instance)
+
+    def convert(self, doc_path, output, filter_name, timeout=None):
+        """
+        Convert doc_path to output with a LibreOffice export filter.
+
+        Raises:
+            TimeoutError: If the conversion takes longer than timeout
+            RuntimeError: If LibreOffice could not convert the document
+        """
+        instance = self.idle.get()
+        try:
+            instance.ensure_running()
+            try:
+                instance.convert(doc_path, output, filter_name, timeout)
+            except TimeoutError:
+                instance.stop()
+                raise
+            except Exception:
+                if instance.is_healthy():
+                    raise
+                # The instance died under this document; retry once on a fresh one
+                instance.restart()
+                instance.convert(doc_path, output, filter_name, timeout)
+        finally:
+            self.idle.put(instance)
+
+    def close(self):
+        """Stop all instances and remove their profiles."""
+        for instance in self.instances:
+            instance.stop()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class _OfficeInstance:
+    """One headless soffice process and its UNO connection."""
+
+    def __init__(self, root, index):
+        self.pipe = f"ooxml_office_{os.getpid()}_{index}"
+        self.profile = root / f"profile{index}"
+        self.process = None
+        self.desktop = None
+
+    def ensure_running(self):
+        if not self.is_healthy():
+            self.restart()
+
+    def is_healthy(self):
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            self.desktop.getFrames()
+            return True
+        except Exception:
+            return False
+
+    def restart(self):
+        self.stop()
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                "--nodefault",
+                f"-env:UserInstallation={self.profile.as_uri()}",
+                f"--accept=pipe,name={self.pipe};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.desktop = self._connect()
+
+    def _connect(self):
+        import uno
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        url = f"uno:pipe,name={self.pipe};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + OFFICE_START_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(url)
+                return context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", context
+                )
+            except Exception:
+                if self.process.poll() is not None:
+                    raise RuntimeError("LibreOffice exited during startup")
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("LibreOffice did not start in time")
+                time.sleep(0.2)
+
+    def convert(self, doc_path, output, filter_name, timeout):
+        errors = []
+
+        def run():
+            try:
+                self._store(doc_path, output, filter_name)
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise TimeoutError(f"Conversion of {Path(doc_path).name} timed out")
+        if errors:
+            raise RuntimeError(f"LibreOffice conversion failed: {errors[0]}")
+        if not Path(output).exists():
+            raise RuntimeError("Document validation failed")
+
+    def _store(self, doc_path, output, filter_name):
+        import uno
+
+        def properties(**values):
+            result = []
+            for name, value in values.items():
+                prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+                prop.Name, prop.Value = name, value
+                result.append(prop)
+            return tuple(result)
+
+        document = self.desktop.loadComponentFromURL(
+            Path(doc_path).as_uri(), "_blank", 0, properties(Hidden=True, ReadOnly=True)
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not open {Path(doc_path).name}")
+        try:
+            document.storeToURL(
+                Path(output).as_uri(), properties(FilterName=filter_name)
+            )
+        finally:
+            document.close(True)
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None and self.desktop is not None:
+                self.desktop.terminate()
+                self.process.wait(timeout=5)
+        except Exception:
+            pass
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.desktop = None
+
+
+def copy_raw_member(source_zip, info, target_zip):
+    """Copy a member between open zip files without recompressing it.
+
+    The compressed bytes are read straight from the source archive and written
+    with a fresh local header, so the member is neither inflated nor deflated.
+
+    Args:
+        source_zip: zipfile.ZipFile opened for reading
+        info: zipfile.ZipInfo of the member in source_zip
+        target_zip: zipfile.ZipFile opened for writing
+    """
+    source = source_zip.fp
+    source.seek(info.header_offset)
+    header = source.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.seek(
+        info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+    )
+    data = source.read(info.compress_size)
+    write_raw_member(target_zip, copy.copy(info), data)
+
+
+def write_raw_member(target_zip, info, data):
+    """Write an already compressed member to a zip file opened for writing.
+
+    Args:
+        target_zip: zipfile.ZipFile opened for writing
+        info: zipfile.ZipInfo with compress_type, CRC, file_size and
+            compress_size matching data
+        data: The compressed bytes
+    """
+    # Sizes and CRC go in the local header, so no trailing data descriptor
+    info.flag_bits &= ~0x08
+    target = target_zip.fp
+    info.header_offset = target.tell()
+    target.write(info.FileHeader(zip64=info.file_size > zipfile.ZIP64_LIMIT))
+    target.write(data)
+    target_zip.filelist.append(info)
+    target_zip.NameToInfo[info.filename] = info
+    target_zip.start_dir = target.tell()
+    target_zip._didModify = True
+
+
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
+    content = Path(xml_file).read_bytes()
 
     # Write back the condensed XML
     with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+        f.write(condense_xml_bytes(content))
+
+
+def condense_xml_bytes(content):
+    """Return XML bytes with pretty-printing whitespace and comments removed."""
+    buffer = io.BytesIO()
+    condense_xml_stream(io.BytesIO(content), buffer)
+    return buffer.getvalue()
+
+
+def condense_xml_stream(source, target):
+    """Condense XML from a binary stream into a binary stream.
+
+    Whitespace-only text and comments are dropped from every element except
+    those whose tag ends in ":t" (w:t, a:t, ...), where text is content. The
+    output matches what minidom's toxml(encoding="UTF-8") gives for the same
+    edit, but the document is parsed with SAX and never held in memory.
+
+    Args:
+        source: Readable binary file object with the XML
+        target: Writable binary file object for the condensed XML
+    """
+    writer = io.TextIOWrapper(
+        target, encoding="UTF-8", errors="xmlcharrefreplace", newline="\n"
+    )
+    handler = _Condenser(writer)
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setProperty(property_lexical_handler, handler)
+    parser.parse(source)
+    writer.flush()
+    writer.detach()
+
+
+class _Condenser(ContentHandler):
+    """SAX handler that writes condensed XML.
+
+    Text is buffered per text node (minidom merges adjacent character data and
+    comments split it), so a node is only written once it is known not to be
+    whitespace-only, and a start tag is only closed once a child is written.
+    """
+
+    def __init__(self, writer):
+        super().__init__()
+        self.write = writer.write
+        # Each frame: [tag name, start tag closed?, keep whitespace?, leaves]
+        self.stack = [[None, True, True, []]]
+        self.in_cdata = False
+
+    # ContentHandler
+
+    def startDocument(self):
+        self.write('<?xml version="1.0" encoding="UTF-8"?>')
+
+    def startElement(self, name, attrs):
+        self._open_child()
+        self.write(f"<{name}")
+        # minidom lists namespace declarations before other attributes
+        names = attrs.getNames()
+        ordered = [n for n in names if n == "xmlns" or n.startswith("xmlns:")]
+        ordered += [n for n in names if n != "xmlns" and not n.startswith("xmlns:")]
+        for attr in ordered:
+            self.write(f' {attr}="{_escape(attrs.getValue(attr))}"')
+        self.stack.append([name, False, name.endswith(":t"), []])
+
+    def endElement(self, name):
+        self._flush_leaves()
+        _, closed, _, _ = self.stack.pop()
+        self.write(f"</{name}>" if closed else "/>")
+
+    def characters(self, content):
+        leaves = self.stack[-1][3]
+        if self.in_cdata or (leaves and not leaves[-1][0]):
+            leaves[-1][1].append(content)
+        else:
+            leaves.append((False, [content]))
+
+    def processingInstruction(self, target, data):
+        self._open_child()
+        self.write(f"<?{target} {data}?>")
+
+    # LexicalHandler
+
+    def comment(self, content):
+        if self.stack[-1][2]:
+            self._open_child()
+            self.write(f"<!--{content}-->")
+        else:
+            # Dropped, but it still separates the text around it
+            self._flush_leaves()
+
+    def startCDATA(self):
+        self.stack[-1][3].append((True, []))
+        self.in_cdata = True
+
+    def endCDATA(self):
+        self.in_cdata = False
+
+    def startDTD(self, name, public_id, system_id):
+        pass
+
+    def endDTD(self):
+        pass
+
+    # Helpers
+
+    def _open_child(self):
+        """Write pending text and close the current start tag."""
+        self._flush_leaves()
+        frame = self.stack[-1]
+        if not frame[1]:
+            self.write(">")
+            frame[1] = True
+
+    def _flush_leaves(self):
+        frame = self.stack[-1]
+        leaves, frame[3] = frame[3], []
+        for is_cdata, chunks in leaves:
+            data = "".join(chunks)
+            if is_cdata:
+                self._close_start_tag(frame)
+                self.write(f"<![CDATA[{data}]]>")
+            elif frame[2] or data.strip() != "":
+                self._close_start_tag(frame)
+                self.write(_escape(data))
+
+    def _close_start_tag(self, frame):
+        if not frame[1]:
+            self.write(">")
+            frame[1] = True
+
+
+def _escape(data):
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
 
 
 if __name__ == "__main__":
@@ -11,29 +11,63 @@ This module provides functionality to:
 - Export to JSON with clean, structured data
 
 Classes:
+    FontIndex: Cached index of installed fonts used for text measurement
+    FontMetrics: Text width measurement with cached glyph advances
+    InventoryCache: Per-slide inventory records keyed by content hash
+    InventoryWriter: Streams an inventory to JSON or NDJSON, slide by slide
+    PackageReader: Read-only slide reader that parses the package XML directly
+    PresentationReader: Slide reader for a python-pptx Presentation
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
+    StyleResolver: Memoized default font sizes of layouts and masters
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    iter_text_inventory: Extract the text of a presentation slide by slide
+    find_overlapping_pairs: Find overlapping rectangles with a sweep line
     save_inventory: Save extracted data to JSON
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--issues-only] [--jobs N] [--no-cache] [--ndjson]
 """
 
 import argparse
+import bisect
+import functools
+import hashlib
+import heapq
 import json
+import os
 import platform
+import posixpath
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from PIL import Image, ImageDraw, ImageFont
+from lxml import etree
+from PIL import ImageFont
 from pptx import Presentation
-from pptx.enum.text import PP_ALIGN
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.oxml.simpletypes import (
+    ST_Coordinate,
+    ST_Coordinate32,
+    ST_PositiveCoordinate,
+    ST_TextFontSize,
+    ST_TextIndentLevelType,
+    ST_TextSpacingPercentOrPercentString,
+    ST_TextSpacingPoint,
+    XsdBoolean,
+)
 from pptx.shapes.base import BaseShape
+from pptx.util import Centipoints, Length
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -60,6 +94,18 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Processes slides in 4 worker processes (output is identical)
+
+  python inventory.py presentation.pptx inventory.ndjson --ndjson
+    Writes one {"slide": ..., "shapes": ...} JSON object per line
+
+Slides are cached in .<input>.inventory-cache next to the input, so only
+slides that changed (or whose layout or master changed) are measured again.
+Use --no-cache to measure every slide and leave no cache file.
+Slides are written as they are measured, so memory use does not grow
+with the size of the deck.
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +122,22 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the per-slide inventory cache",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write one JSON object per slide and line instead of a single object",
+    )
 
     args = parser.parse_args()
 
@@ -94,17 +156,26 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
-
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+
+        # Write each slide as soon as it is measured
+        total_shapes = 0
+        with InventoryWriter(output_path, ndjson=args.ndjson) as writer:
+            for slide_key, shapes in iter_text_inventory(
+                input_path,
+                issues_only=args.issues_only,
+                jobs=args.jobs or os.cpu_count() or 1,
+                cache=not args.no_cache,
+                read_only=True,
+            ):
+                writer.write_slide(slide_key, shapes)
+                total_shapes += len(shapes)
 
         print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
+        total_slides = writer.slide_count
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -134,16 +205,385 @@ class ShapeWithPosition:
     absolute_top: int  # in EMUs
 
 
+class FontIndex:
+    """Index of installed font files by family name and file name.
+
+    The font directories are scanned recursively once, reading each file's
+    family and style from its name table. The index is persisted to a cache
+    file and reused until the mtime of any scanned directory changes, so
+    resolving a font name is a dictionary lookup.
+    """
+
+    # Bump when the cache layout changes
+    VERSION = 1
+
+    def __init__(self, font_dirs: List[str], extensions: List[str], cache_path: Path):
+        self.font_dirs = [Path(d).expanduser() for d in font_dirs]
+        self.extensions = tuple(extensions)
+        self.cache_path = cache_path
+        self.dir_mtimes: Dict[str, float] = {}
+        # Lowercase family name -> [(style, path)]
+        self.families: Dict[str, List[Tuple[str, str]]] = {}
+        # Lowercase file stem -> path
+        self.stems: Dict[str, str] = {}
+        # Lowercase file name -> path, in scan order (for substring matches)
+        self.files: Dict[str, str] = {}
+        self._lookups: Dict[str, Optional[str]] = {}
+        if not self._load():
+            self._scan()
+            self._save()
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Return the path of the font file for font_name, or None."""
+        if font_name not in self._lookups:
+            self._lookups[font_name] = self._resolve(font_name)
+        return self._lookups[font_name]
+
+    def _resolve(self, font_name: str) -> Optional[str]:
+        # Family name from the font file, preferring the regular style
+        styles = self.families.get(font_name.lower())
+        if styles:
+            for style, path in styles:
+                if style.lower() in ("regular", "book", "normal", "roman"):
+                    return path
+            return styles[0][1]
+
+        # File named after the font
+        for variant in (
+            font_name.lower(),
+            font_name.lower().replace(" ", ""),
+            font_name.lower().replace(" ", "-"),
+        ):
+            if variant in self.stems:
+                return self.stems[variant]
+
+        # File name containing the font name
+        needle = font_name.lower().replace(" ", "")
+        for file_name, path in self.files.items():
+            if needle in file_name:
+                return path
+        return None
+
+    def _load(self) -> bool:
+        """Load the cached index if no font directory changed since it was built.
+
+        Adding or removing a file or subdirectory changes its directory's mtime,
+        and a removed directory fails to stat, so checking the recorded mtimes
+        is enough.
+        """
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != self.VERSION or data.get("roots") != [
+                str(d) for d in self.font_dirs
+            ]:
+                return False
+            for directory, mtime in data["dir_mtimes"].items():
+                if os.stat(directory).st_mtime != mtime:
+                    return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self.dir_mtimes = data["dir_mtimes"]
+        self.families = {k: [tuple(e) for e in v] for k, v in data["families"].items()}
+        self.stems = data["stems"]
+        self.files = data["files"]
+        return True
+
+    def _save(self) -> None:
+        data = {
+            "version": self.VERSION,
+            "roots": [str(d) for d in self.font_dirs],
+            "dir_mtimes": self.dir_mtimes,
+            "families": self.families,
+            "stems": self.stems,
+            "files": self.files,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            temp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass  # The index still works, it just is not persisted
+
+    def _scan(self) -> None:
+        for root in self.font_dirs:
+            if not root.is_dir():
+                continue
+            for directory, subdirs, file_names in os.walk(root):
+                subdirs.sort()
+                try:
+                    self.dir_mtimes[directory] = os.stat(directory).st_mtime
+                except OSError:
+                    continue
+                for file_name in sorted(file_names):
+                    if not file_name.lower().endswith(self.extensions):
+                        continue
+                    path = os.path.join(directory, file_name)
+                    stem = os.path.splitext(file_name)[0].lower()
+                    self.stems.setdefault(stem, path)
+                    self.files.setdefault(file_name.lower(), path)
+                    try:
+                        family, style = ImageFont.truetype(path, size=12).getname()
+                    except Exception:
+                        continue  # Not readable by PIL; still indexed by file name
+                    if family:
+                        self.families.setdefault(family.lower(), []).append(
+                            (style or "", path)
+                        )
+
+
+_font_index: Optional[FontIndex] = None
+
+
+def get_font_index() -> FontIndex:
+    """Return the font index for this platform, building or loading it once."""
+    global _font_index
+    if _font_index is None:
+        if platform.system() == "Darwin":  # macOS
+            font_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+        else:  # Linux
+            font_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            extensions = [".ttf", ".otf"]
+        cache_dir = Path(
+            os.environ.get("XDG_CACHE_HOME", Path("~/.cache").expanduser())
+        )
+        _font_index = FontIndex(
+            font_dirs, extensions, cache_dir / "pptx-inventory" / "font-index.json"
+        )
+    return _font_index
+
+
+class FontMetrics:
+    """Text measurement for one font at one size, with cached glyph advances.
+
+    The width of a string is the sum of its characters' advances plus a
+    kerning adjustment for each adjacent pair. Advances and pair adjustments
+    are measured once with PIL and then looked up, and word widths are cached
+    too, so wrapping measures every word and space once.
+    """
+
+    # Cached word widths kept per font before the cache is reset
+    MAX_CACHED_WORDS = 50000
+
+    def __init__(self, font: Any):
+        self.font = font
+        self.advances: Dict[str, float] = {}
+        self.kerning: Dict[str, float] = {}
+        self.words: Dict[str, float] = {}
+
+    def text_width(self, text: str) -> float:
+        """Width of text in pixels."""
+        width = self.words.get(text)
+        if width is not None:
+            return width
+        width = 0.0
+        previous = None
+        for char in text:
+            width += self._advance(char)
+            if previous is not None:
+                width += self._kern(previous, char)
+            previous = char
+        if len(self.words) >= self.MAX_CACHED_WORDS:
+            self.words.clear()
+        self.words[text] = width
+        return width
+
+    def wrap_lines(self, lines: List[str], max_width: float) -> List[str]:
+        """Wrap lines at spaces so each fits in max_width (if possible).
+
+        Words are measured once and line widths accumulated, including the
+        space and the kerning at each join, so wrapping is linear in the
+        number of words. A word wider than max_width gets a line of its own.
+        """
+        space = self._advance(" ")
+        wrapped: List[str] = []
+        for line in lines:
+            if self.text_width(line) <= max_width:
+                wrapped.append(line)
+                continue
+
+            words = line.split(" ")
+            widths = [self.text_width(word) for word in words]
+            current: List[str] = []
+            current_width = 0.0
+            last_char: Optional[str] = None
+            for word, width in zip(words, widths):
+                if current:
+                    added = self._kern(last_char, " ") + space if last_char else space
+                    if word:
+                        added += self._kern(" ", word[0]) + width
+                    if current_width + added <= max_width:
+                        current.append(word)
+                        current_width += added
+                        last_char = word[-1] if word else " "
+                        continue
+                    wrapped.append(" ".join(current))
+                    current = []
+                if not word:
+                    # Spaces at the start of a line are dropped
+                    continue
+                current, current_width, last_char = [word], width, word[-1]
+            if current:
+                wrapped.append(" ".join(current))
+        return wrapped
+
+    def _advance(self, char: str) -> float:
+        advance = self.advances.get(char)
+        if advance is None:
+            advance = self.advances[char] = self.font.getlength(char)
+        return advance
+
+    def _kern(self, first: str, second: str) -> float:
+        pair = first + second
+        adjustment = self.kerning.get(pair)
+        if adjustment is None:
+            adjustment = self.kerning[pair] = (
+                self.font.getlength(pair) - self._advance(first) - self._advance(second)
+            )
+        return adjustment
+
+
+# Number of (font file, size) combinations kept loaded for measurement
+FONT_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def get_font_metrics(font_path: Optional[str], font_size: int) -> FontMetrics:
+    """Return shared FontMetrics for a font file and size.
+
+    Falls back to PIL's default font if the path is None or cannot be loaded.
+    """
+    font = None
+    if font_path:
+        try:
+            font = ImageFont.truetype(font_path, size=font_size)
+        except Exception:
+            pass
+    return FontMetrics(font or ImageFont.load_default())
+
+
+# Tags of the text elements read from slide XML
+_A_P = qn("a:p")
+_A_PPR = qn("a:pPr")
+_A_R = qn("a:r")
+_A_RPR = qn("a:rPr")
+_A_T = qn("a:t")
+_A_BR = qn("a:br")
+_A_FLD = qn("a:fld")
+_P_TXBODY = qn("p:txBody")
+_P_SP = qn("p:sp")
+_P_GRPSP = qn("p:grpSp")
+
+# Paragraph alignments reported in the inventory (LEFT is the default)
+ALIGNMENT_NAMES = {"ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+
+# Color elements of an a:solidFill, in the order python-pptx looks for them
+_COLOR_TAGS = tuple(
+    qn(f"a:{name}")
+    for name in ("scrgbClr", "srgbClr", "hslClr", "sysClr", "schemeClr", "prstClr")
+)
+
+# Fill elements of an a:rPr in lookup order; only a:solidFill gives a text color
+_FILL_TAGS = tuple(
+    qn(f"a:{name}")
+    for name in ("noFill", "solidFill", "gradFill", "blipFill", "pattFill", "grpFill")
+)
+
+
+def paragraph_text(p: Any) -> str:
+    """Return the text of an a:p element the way python-pptx reports it.
+
+    Runs and fields contribute their a:t text and line breaks a vertical tab.
+    """
+    parts = []
+    for child in p:
+        if child.tag == _A_BR:
+            parts.append("\v")
+        elif child.tag == _A_R or child.tag == _A_FLD:
+            t = child.find(_A_T)
+            parts.append((t.text if t is not None else None) or "")
+    return "".join(parts)
+
+
+def text_body_text(txBody: Any) -> str:
+    """Return the text of a p:txBody element, one line per paragraph."""
+    return "\n".join(paragraph_text(p) for p in txBody.iterchildren(_A_P))
+
+
+def _first_child_found_in(element: Any, tags: Tuple[str, ...]) -> Any:
+    """Return the first child with one of tags, trying the tags in order."""
+    for tag in tags:
+        child = element.find(tag)
+        if child is not None:
+            return child
+    return None
+
+
+def _text_spacing(
+    spacing: Any, points_only: bool = False
+) -> Union[Length, float, None]:
+    """Return the value of an a:spcBef, a:spcAft or a:lnSpc element.
+
+    Point spacing is returned as a Length and percentage spacing as a number
+    of lines, or None when points_only is set.
+    """
+    if spacing is None:
+        return None
+    spcPts = spacing.find(qn("a:spcPts"))
+    if spcPts is not None:
+        return ST_TextSpacingPoint.from_xml(spcPts.get("val"))
+    spcPct = spacing.find(qn("a:spcPct"))
+    if points_only or spcPct is None:
+        return None
+    return ST_TextSpacingPercentOrPercentString.from_xml(spcPct.get("val"))
+
+
 class ParagraphData:
-    """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
+    """Data structure for paragraph properties extracted from a PowerPoint paragraph.
+
+    Properties are read straight from the paragraph's a:p element, so the
+    same code serves python-pptx paragraphs and elements parsed directly
+    from the package. python-pptx's alignment and font accessors create
+    missing pPr/rPr elements (and font.color replaces the run fill with an
+    empty solidFill), so they are avoided to keep extraction free of side
+    effects on the document. Values are converted with python-pptx's own
+    simple types so they match what its accessors return.
+    """
+
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
 
     def __init__(self, paragraph: Any):
-        """Initialize from a PowerPoint paragraph object.
+        """Initialize from a PowerPoint paragraph object or a:p element.
 
         Args:
-            paragraph: The PowerPoint paragraph object
+            paragraph: The PowerPoint paragraph object, or its a:p element
         """
-        self.text: str = paragraph.text.strip()
+        p = paragraph._p if hasattr(paragraph, "_p") else paragraph
+        self.text: str = paragraph_text(p).strip()
         self.bullet: bool = False
         self.level: Optional[int] = None
         self.alignment: Optional[str] = None
@@ -153,80 +593,84 @@ class ParagraphData:
         self.font_size: Optional[float] = None
         self.bold: Optional[bool] = None
         self.italic: Optional[bool] = None
-        self.underline: Optional[bool] = None
+        self.underline: Optional[Any] = None
         self.color: Optional[str] = None
         self.theme_color: Optional[str] = None
         self.line_spacing: Optional[float] = None
 
+        pPr = p.find(_A_PPR)
+        if pPr is not None:
+            self._read_paragraph_properties(pPr)
+
+        # Extract font properties from first run (a run without rPr has none)
+        run = p.find(_A_R)
+        rPr = run.find(_A_RPR) if run is not None else None
+        if rPr is not None:
+            self._read_run_properties(rPr)
+
+        # Add line spacing if set
+        if pPr is not None:
+            line_spacing = _text_spacing(pPr.find(qn("a:lnSpc")))
+            if isinstance(line_spacing, Length):
+                self.line_spacing = round(line_spacing.pt, 2)
+            elif line_spacing is not None:
+                # Multiplier - convert to points
+                font_size = self.font_size if self.font_size else 12.0
+                self.line_spacing = round(line_spacing * font_size, 2)
+
+    def _read_paragraph_properties(self, pPr: Any) -> None:
+        """Read bullet, alignment and spacing from an a:pPr element."""
         # Check for bullet formatting
         if (
-            hasattr(paragraph, "_p")
-            and paragraph._p is not None
-            and paragraph._p.pPr is not None
+            pPr.find(qn("a:buChar")) is not None
+            or pPr.find(qn("a:buAutoNum")) is not None
         ):
-            pPr = paragraph._p.pPr
-            ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
-            if (
-                pPr.find(f"{ns}buChar") is not None
-                or pPr.find(f"{ns}buAutoNum") is not None
-            ):
-                self.bullet = True
-                if hasattr(paragraph, "level"):
-                    self.level = paragraph.level
+            self.bullet = True
+            lvl = pPr.get("lvl")
+            self.level = ST_TextIndentLevelType.from_xml(lvl) if lvl else 0
 
         # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
-            alignment_map = {
-                PP_ALIGN.CENTER: "CENTER",
-                PP_ALIGN.RIGHT: "RIGHT",
-                PP_ALIGN.JUSTIFY: "JUSTIFY",
-            }
-            if paragraph.alignment in alignment_map:
-                self.alignment = alignment_map[paragraph.alignment]
-
-        # Add spacing properties if set
-        if hasattr(paragraph, "space_before") and paragraph.space_before:
-            self.space_before = paragraph.space_before.pt
-        if hasattr(paragraph, "space_after") and paragraph.space_after:
-            self.space_after = paragraph.space_after.pt
-
-        # Extract font properties from first run
-        if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
-                if font.name:
-                    self.font_name = font.name
-                if font.size:
-                    self.font_size = font.size.pt
-                if font.bold is not None:
-                    self.bold = font.bold
-                if font.italic is not None:
-                    self.italic = font.italic
-                if font.underline is not None:
-                    self.underline = font.underline
-
-                # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
-                    try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
-                    except (AttributeError, TypeError):
-                        pass
-
-        # Add line spacing if set
-        if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
-            if hasattr(paragraph.line_spacing, "pt"):
-                self.line_spacing = round(paragraph.line_spacing.pt, 2)
+        self.alignment = ALIGNMENT_NAMES.get(pPr.get("algn"))
+
+        # Add spacing properties if set (spcPts only, like python-pptx)
+        space_before = _text_spacing(pPr.find(qn("a:spcBef")), points_only=True)
+        if space_before:
+            self.space_before = space_before.pt
+        space_after = _text_spacing(pPr.find(qn("a:spcAft")), points_only=True)
+        if space_after:
+            self.space_after = space_after.pt
+
+    def _read_run_properties(self, rPr: Any) -> None:
+        """Read font name, size, style and solid color from an a:rPr element."""
+        latin = rPr.find(qn("a:latin"))
+        if latin is not None and latin.get("typeface"):
+            self.font_name = latin.get("typeface")
+        if rPr.get("sz"):
+            self.font_size = Centipoints(ST_TextFontSize.from_xml(rPr.get("sz"))).pt
+        if rPr.get("b") is not None:
+            self.bold = XsdBoolean.from_xml(rPr.get("b"))
+        if rPr.get("i") is not None:
+            self.italic = XsdBoolean.from_xml(rPr.get("i"))
+        if rPr.get("u") is not None:
+            underline = MSO_UNDERLINE.from_xml(rPr.get("u"))
+            if underline is MSO_UNDERLINE.NONE:
+                self.underline = False
+            elif underline is MSO_UNDERLINE.SINGLE_LINE:
+                self.underline = True
             else:
-                # Multiplier - convert to points
-                font_size = self.font_size if self.font_size else 12.0
-                self.line_spacing = round(paragraph.line_spacing * font_size, 2)
+                self.underline = underline
+
+        # Handle color - both RGB and theme colors (solid fills only)
+        fill = _first_child_found_in(rPr, _FILL_TAGS)
+        if fill is None or fill.tag != qn("a:solidFill"):
+            return
+        color = _first_child_found_in(fill, _COLOR_TAGS)
+        if color is None or not color.get("val"):
+            return
+        if color.tag == qn("a:srgbClr"):
+            self.color = str(RGBColor.from_string(color.get("val")))
+        elif color.tag == qn("a:schemeClr"):
+            self.theme_color = MSO_THEME_COLOR.from_xml(color.get("val")).name
 
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
@@ -263,9 +707,179 @@ class ParagraphData:
         return result
 
 
+# Shape elements of a shape tree, in the order python-pptx iterates them
+SHAPE_TAGS = frozenset(
+    qn(f"p:{name}")
+    for name in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+)
+
+# Text frame insets: (side, bodyPr attribute, python-pptx default in EMUs)
+TEXT_FRAME_INSETS = (
+    ("top", "tIns", 45720),
+    ("bottom", "bIns", 45720),
+    ("left", "lIns", 91440),
+    ("right", "rIns", 91440),
+)
+
+
+def placeholder_element(shape_element: Any) -> Any:
+    """Return the p:ph element of a shape element, or None if it has none."""
+    nv_properties = next(shape_element.iterchildren(tag=etree.Element), None)
+    if nv_properties is None:
+        return None
+    nvPr = nv_properties.find(qn("p:nvPr"))
+    return nvPr.find(qn("p:ph")) if nvPr is not None else None
+
+
+def iter_placeholders(root: Any) -> Iterator[Tuple[Any, Any]]:
+    """Yield (shape element, p:ph) for the top-level placeholders of a part."""
+    spTree = root.find(f"{qn('p:cSld')}/{qn('p:spTree')}")
+    if spTree is None:
+        return
+    for element in spTree:
+        if element.tag in SHAPE_TAGS:
+            ph = placeholder_element(element)
+            if ph is not None:
+                yield element, ph
+
+
+def layout_default_font_sizes(layout: Any) -> Dict[str, Optional[float]]:
+    """Return the default font size of each placeholder type on a layout.
+
+    The size is the first defRPr sz in the first placeholder of each type.
+
+    Args:
+        layout: Root element of the slide layout
+
+    Returns:
+        Placeholder type as in the XML (e.g. 'title' or 'obj') -> size in
+        points, or None if that placeholder sets no size
+    """
+    sizes: Dict[str, Optional[float]] = {}
+    for element, ph in iter_placeholders(layout):
+        ph_type = ph.get("type", "obj")
+        if ph_type in sizes:
+            continue
+        sizes[ph_type] = None
+        try:
+            # Find first defRPr element with sz (size) attribute
+            for elem in element.iter():
+                if "defRPr" in elem.tag and (sz := elem.get("sz")):
+                    sizes[ph_type] = float(sz) / 100.0  # Convert centipoints to points
+                    break
+        except Exception:
+            pass
+    return sizes
+
+
+def master_default_font_size(master: Any, style_name: str) -> int:
+    """Return the first font size in one of a slide master's text styles.
+
+    Args:
+        master: Root element of the slide master, or None
+        style_name: 'titleStyle' or 'bodyStyle'
+
+    Returns:
+        Font size in points, or a conservative 14 if none is found
+    """
+    if master is None:
+        return 14
+
+    try:
+        # Find font size in theme styles
+        for child in master.iter():
+            tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
+            if tag == style_name:
+                for elem in child.iter():
+                    if "sz" in elem.attrib:
+                        return int(elem.attrib["sz"]) // 100
+    except Exception:
+        pass
+
+    return 14  # Conservative default for body text
+
+
+class StyleResolver:
+    """Default font sizes of a presentation's layouts and masters.
+
+    Every shape on the same layout or master needs the same default sizes,
+    so they are computed once per layout (for all of its placeholder types)
+    and once per (master, text style), then looked up. Readers share one
+    resolver between all the ShapeData of a presentation. Layouts and
+    masters are keyed by their root elements.
+    """
+
+    def __init__(self):
+        self._layout_sizes: Dict[Any, Dict[str, Optional[float]]] = {}
+        self._master_sizes: Dict[Tuple[Any, str], int] = {}
+
+    def layout_font_size(self, layout: Any, ph_type: str) -> Optional[float]:
+        """Return the default size of a layout's placeholder type, in points.
+
+        Args:
+            layout: Root element of the slide layout
+            ph_type: Placeholder type as in the XML, e.g. 'title' or 'obj'
+        """
+        if layout not in self._layout_sizes:
+            self._layout_sizes[layout] = layout_default_font_sizes(layout)
+        return self._layout_sizes[layout].get(ph_type)
+
+    def master_font_size(self, master: Any, placeholder_type: Optional[str]) -> int:
+        """Return the master's title or body text size for a placeholder type.
+
+        Args:
+            master: Root element of the slide master, or None
+            placeholder_type: Placeholder type name; titles use titleStyle
+                and everything else bodyStyle
+        """
+        # Determine theme style based on placeholder type
+        style_name = "bodyStyle"  # Default
+        if placeholder_type and "TITLE" in placeholder_type:
+            style_name = "titleStyle"
+
+        key = (master, style_name)
+        if key not in self._master_sizes:
+            self._master_sizes[key] = master_default_font_size(master, style_name)
+        return self._master_sizes[key]
+
+
 class ShapeData:
     """Data structure for shape properties extracted from a PowerPoint shape."""
 
+    # Computed attributes carried by to_record/from_record
+    RECORD_FIELDS = (
+        "shape_id",
+        "slide_width_emu",
+        "slide_height_emu",
+        "placeholder_type",
+        "default_font_size",
+        "left",
+        "top",
+        "width",
+        "height",
+        "left_emu",
+        "top_emu",
+        "width_emu",
+        "height_emu",
+        "frame_overflow_bottom",
+        "slide_overflow_right",
+        "slide_overflow_bottom",
+        "overlapping_shapes",
+        "warnings",
+    )
+
+    # Compact instances: the record fields plus references to the source XML
+    __slots__ = RECORD_FIELDS + (
+        "_shape",
+        "_locate_shape",
+        "_locate_text_body",
+        "_text_body",
+        "_master",
+        "_styles",
+        "_paragraphs",
+        "_paragraph_dicts",
+    )
+
     @staticmethod
     def emu_to_inches(emu: int) -> float:
         """Convert EMUs (English Metric Units) to inches."""
@@ -286,61 +900,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_index().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -374,16 +934,11 @@ class ShapeData:
                 return None
 
             shape_type = shape.placeholder_format.type  # type: ignore
-            for layout_placeholder in slide_layout.placeholders:
-                if layout_placeholder.placeholder_format.type == shape_type:
-                    # Find first defRPr element with sz (size) attribute
-                    for elem in layout_placeholder.element.iter():
-                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
-                            return float(sz) / 100.0  # Convert EMUs to points
-                    break
+            return layout_default_font_sizes(slide_layout.element).get(
+                shape_type.xml_value
+            )
         except Exception:
-            pass
-        return None
+            return None
 
     def __init__(
         self,
@@ -391,6 +946,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        styles: Optional[StyleResolver] = None,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,8 +955,19 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            styles: StyleResolver shared by the shapes of the presentation
         """
-        self.shape = shape  # Store reference to original shape
+        self._shape: Optional[BaseShape] = shape  # Reference to original shape
+        self._locate_shape: Optional[Callable[[], BaseShape]] = None
+        self._locate_text_body: Optional[Callable[[], Any]] = None
+        self._paragraphs: Optional[List[ParagraphData]] = None
+        self._paragraph_dicts: Optional[List[ParagraphDict]] = None
+        self._text_body: Any = shape.element.find(_P_TXBODY)
+        try:
+            self._master: Any = shape.part.slide_layout.slide_master.element  # type: ignore
+        except AttributeError:
+            self._master = None
+        self._styles = styles or StyleResolver()
         self.shape_id: str = ""  # Will be set after sorting
 
         # Get slide dimensions from slide object
@@ -419,8 +986,9 @@ class ShapeData:
 
                 # Get default font size from layout
                 if slide and hasattr(slide, "slide_layout"):
-                    self.default_font_size = self.get_default_font_size(
-                        shape, slide.slide_layout
+                    self.default_font_size = self._styles.layout_font_size(
+                        slide.slide_layout.element,
+                        shape.placeholder_format.type.xml_value,  # type: ignore
                     )
 
         # Get position information
@@ -435,25 +1003,146 @@ class ShapeData:
             if absolute_top is not None
             else (shape.top if hasattr(shape, "top") else 0)
         )
-
-        self.left: float = round(self.emu_to_inches(left_emu), 2)  # type: ignore
-        self.top: float = round(self.emu_to_inches(top_emu), 2)  # type: ignore
-        self.width: float = round(
-            self.emu_to_inches(shape.width if hasattr(shape, "width") else 0),
-            2,  # type: ignore
-        )
-        self.height: float = round(
-            self.emu_to_inches(shape.height if hasattr(shape, "height") else 0),
-            2,  # type: ignore
+        self._set_geometry(
+            left_emu,  # type: ignore
+            top_emu,  # type: ignore
+            shape.width if hasattr(shape, "width") else 0,  # type: ignore
+            shape.height if hasattr(shape, "height") else 0,  # type: ignore
         )
+        self._measure()
+
+    @classmethod
+    def from_xml(
+        cls,
+        txBody: Any,
+        master: Any,
+        geometry: Tuple[int, int, int, int],
+        slide_size: Tuple[Optional[int], Optional[int]],
+        placeholder_type: Optional[str] = None,
+        default_font_size: Optional[float] = None,
+        styles: Optional[StyleResolver] = None,
+    ) -> "ShapeData":
+        """Build a ShapeData from elements parsed directly from the package.
+
+        Args:
+            txBody: The shape's p:txBody element
+            master: Root element of the slide master, for theme text styles
+            geometry: Absolute (left, top, width, height) in EMUs
+            slide_size: (width, height) of the slides in EMUs
+            placeholder_type: Placeholder type name, e.g. 'TITLE'
+            default_font_size: Font size from the layout placeholder in points
+            styles: StyleResolver shared by the shapes of the presentation
+        """
+        shape_data = cls.__new__(cls)
+        shape_data._shape = None
+        shape_data._locate_shape = None
+        shape_data._locate_text_body = None
+        shape_data._paragraphs = None
+        shape_data._paragraph_dicts = None
+        shape_data._text_body = txBody
+        shape_data._master = master
+        shape_data._styles = styles or StyleResolver()
+        shape_data.shape_id = ""
+        shape_data.slide_width_emu, shape_data.slide_height_emu = slide_size
+        shape_data.placeholder_type = placeholder_type
+        shape_data.default_font_size = default_font_size
+        shape_data._set_geometry(*geometry)
+        shape_data._measure()
+        return shape_data
+
+    @classmethod
+    def from_record(
+        cls,
+        record: tuple,
+        locate_shape: Optional[Callable[[], BaseShape]] = None,
+        locate_text_body: Optional[Callable[[], Any]] = None,
+    ) -> "ShapeData":
+        """Rebuild a ShapeData from to_record output without re-measuring.
+
+        Args:
+            record: Tuple returned by to_record
+            locate_shape: Callable returning the PowerPoint shape, called on
+                first access of the shape attribute
+            locate_text_body: Callable returning the p:txBody element, for
+                records rebuilt without PowerPoint shapes
+        """
+        values, paragraph_dicts = record
+        shape_data = cls.__new__(cls)
+        for name, value in zip(cls.RECORD_FIELDS, values):
+            setattr(shape_data, name, value)
+        shape_data._shape = None
+        shape_data._locate_shape = locate_shape
+        shape_data._locate_text_body = locate_text_body
+        shape_data._paragraphs = None
+        shape_data._paragraph_dicts = paragraph_dicts
+        shape_data._text_body = None
+        shape_data._master = None
+        shape_data._styles = None
+        return shape_data
+
+    def to_record(self) -> tuple:
+        """Return the computed attributes and paragraphs as a picklable tuple."""
+        values = tuple(getattr(self, name) for name in self.RECORD_FIELDS)
+        return values, [para.to_dict() for para in self.paragraphs]
+
+    @property
+    def shape(self) -> Optional[BaseShape]:
+        """The PowerPoint shape (located on first access for rebuilt records).
+
+        None for shapes read directly from the package XML.
+        """
+        if self._shape is None and self._locate_shape is not None:
+            self._shape = self._locate_shape()
+            self._locate_shape = None
+        return self._shape
+
+    @property
+    def paragraphs(self) -> List[ParagraphData]:
+        """Paragraphs with text, read from the shape's text body on first access.
+
+        The list is kept, so a ShapeData reflects the text it was built from;
+        build a new one to measure a shape after editing its text.
+        """
+        if self._paragraphs is None:
+            txBody = self._get_text_body()
+            self._paragraphs = (
+                [
+                    ParagraphData(p)
+                    for p in txBody.iterchildren(_A_P)
+                    if paragraph_text(p).strip()
+                ]
+                if txBody is not None
+                else []
+            )
+        return self._paragraphs
+
+    def _get_text_body(self) -> Any:
+        """Return the shape's p:txBody element, or None if it has no text."""
+        if self._text_body is None:
+            if self._locate_text_body is not None:
+                self._text_body = self._locate_text_body()
+                self._locate_text_body = None
+            elif self.shape is not None:
+                self._text_body = self.shape.element.find(_P_TXBODY)
+        return self._text_body
+
+    def _set_geometry(
+        self, left_emu: int, top_emu: int, width_emu: int, height_emu: int
+    ) -> None:
+        """Set the position and size in inches and in EMUs."""
+        self.left: float = round(self.emu_to_inches(left_emu), 2)
+        self.top: float = round(self.emu_to_inches(top_emu), 2)
+        self.width: float = round(self.emu_to_inches(width_emu), 2)
+        self.height: float = round(self.emu_to_inches(height_emu), 2)
 
         # Store EMU positions for overflow calculations
         self.left_emu = left_emu
         self.top_emu = top_emu
-        self.width_emu = shape.width if hasattr(shape, "width") else 0
-        self.height_emu = shape.height if hasattr(shape, "height") else 0
+        self.width_emu = width_emu
+        self.height_emu = height_emu
 
-        # Calculate overflow status
+    def _measure(self) -> None:
+        """Calculate overflow status and formatting warnings."""
         self.frame_overflow_bottom: Optional[float] = None
         self.slide_overflow_right: Optional[float] = None
         self.slide_overflow_bottom: Optional[float] = None
@@ -465,61 +1154,22 @@ class ShapeData:
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
-    @property
-    def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return []
-
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
-
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
-        try:
-            if not (
-                hasattr(self.shape, "part") and hasattr(self.shape.part, "slide_layout")
-            ):
-                return 14
-
-            slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
-            if not hasattr(slide_master, "element"):
-                return 14
-
-            # Determine theme style based on placeholder type
-            style_name = "bodyStyle"  # Default
-            if self.placeholder_type and "TITLE" in self.placeholder_type:
-                style_name = "titleStyle"
-
-            # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
-        except Exception:
-            pass
-
-        return 14  # Conservative default for body text
+        return self._styles.master_font_size(self._master, self.placeholder_type)
 
-    def _get_usable_dimensions(self, text_frame) -> Tuple[int, int]:
+    def _get_usable_dimensions(self, txBody: Any) -> Tuple[int, int]:
         """Get usable width and height in pixels after accounting for margins."""
         # Default PowerPoint margins in inches
         margins = {"top": 0.05, "bottom": 0.05, "left": 0.1, "right": 0.1}
 
-        # Override with actual margins if set
-        if hasattr(text_frame, "margin_top") and text_frame.margin_top:
-            margins["top"] = self.emu_to_inches(text_frame.margin_top)
-        if hasattr(text_frame, "margin_bottom") and text_frame.margin_bottom:
-            margins["bottom"] = self.emu_to_inches(text_frame.margin_bottom)
-        if hasattr(text_frame, "margin_left") and text_frame.margin_left:
-            margins["left"] = self.emu_to_inches(text_frame.margin_left)
-        if hasattr(text_frame, "margin_right") and text_frame.margin_right:
-            margins["right"] = self.emu_to_inches(text_frame.margin_right)
+        # Override with actual margins if set (python-pptx's inset defaults apply)
+        bodyPr = txBody.find(qn("a:bodyPr"))
+        for side, attribute, default in TEXT_FRAME_INSETS:
+            value = bodyPr.get(attribute) if bodyPr is not None else None
+            margin = ST_Coordinate32.from_xml(value) if value is not None else default
+            if margin:
+                margins[side] = self.emu_to_inches(margin)
 
         # Calculate usable area
         usable_width = self.width - margins["left"] - margins["right"]
@@ -531,83 +1181,47 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
+    def _wrap_text_line(
+        self, line: str, max_width_px: int, metrics: "FontMetrics"
+    ) -> List[str]:
         """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
-
-        return wrapped
+        return metrics.wrap_lines([line], max_width_px)
 
     def _estimate_frame_overflow(self) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
+        txBody = self._get_text_body()
+        if txBody is None:
             return
 
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
+        # Unstripped text of the paragraphs with text, with their position
+        lines = [
+            (para_idx, text)
+            for para_idx, paragraph in enumerate(txBody.iterchildren(_A_P))
+            if (text := paragraph_text(paragraph)).strip()
+        ]
+        if not lines:
             return
 
         # Get usable dimensions after accounting for margins
-        usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
+        usable_width_px, usable_height_px = self._get_usable_dimensions(txBody)
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
+        for (para_idx, text), para_data in zip(lines, self.paragraphs):
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            metrics = get_font_metrics(self.get_font_path(font_name), font_size)
 
             # Wrap all lines in this paragraph
-            all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
-                all_wrapped_lines.extend(wrapped)
+            all_wrapped_lines = metrics.wrap_lines(text.split("\n"), usable_width_px)
 
             if all_wrapped_lines:
                 # Calculate line height
@@ -659,18 +1273,11 @@ class ShapeData:
 
     def _detect_bullet_issues(self) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
-
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for paragraph in self.paragraphs:
+            text = paragraph.text
             # Check for manual bullet symbols
             if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
                 self.warnings.append(
@@ -734,31 +1341,42 @@ class ShapeData:
             result["warnings"] = self.warnings
 
         # Add paragraphs after placeholder_type
-        result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
+        if self._paragraph_dicts is not None:
+            result["paragraphs"] = self._paragraph_dicts
+        else:
+            result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
 
         return result
 
 
 def is_valid_shape(shape: BaseShape) -> bool:
     """Check if a shape contains meaningful text content."""
-    # Must have a text frame with content
-    if not hasattr(shape, "text_frame") or not shape.text_frame:  # type: ignore
+    # Must have a text frame with content (text_frame would add a missing txBody)
+    if not getattr(shape, "has_text_frame", False):
         return False
-
-    text = shape.text_frame.text.strip()  # type: ignore
-    if not text:
+    txBody = shape.element.find(_P_TXBODY)
+    if txBody is None:
         return False
 
-    # Skip slide numbers and numeric footers
+    placeholder_type = None
     if hasattr(shape, "is_placeholder") and shape.is_placeholder:  # type: ignore
         if shape.placeholder_format and shape.placeholder_format.type:  # type: ignore
             placeholder_type = (
                 str(shape.placeholder_format.type).split(".")[-1].split(" ")[0]  # type: ignore
             )
-            if placeholder_type == "SLIDE_NUMBER":
-                return False
-            if placeholder_type == "FOOTER" and text.isdigit():
-                return False
+    return is_content_text(text_body_text(txBody).strip(), placeholder_type)
+
+
+def is_content_text(text: str, placeholder_type: Optional[str]) -> bool:
+    """Check if a shape's stripped text belongs in the inventory."""
+    if not text:
+        return False
+
+    # Skip slide numbers and numeric footers
+    if placeholder_type == "SLIDE_NUMBER":
+        return False
+    if placeholder_type == "FOOTER" and text.isdigit():
+        return False
 
     return True
 
@@ -879,6 +1497,132 @@ def calculate_overlap(
     return False, 0
 
 
+# Slack (in inches) on the vertical bounds used to pick overlap candidates
+OVERLAP_EPSILON = 1e-9
+
+
+def find_overlapping_pairs(
+    rects: List[Tuple[float, float, float, float]], tolerance: float = 0.05
+) -> List[Tuple[int, int, float]]:
+    """Find every pair of rectangles that overlap by more than tolerance.
+
+    Sweeps a vertical line across the rectangles in order of their left edge.
+    The rectangles it currently crosses are kept in a heap keyed by right
+    edge, so they are dropped once the line has passed them, and indexed by
+    their vertical extent: those spanning the top of the next rectangle come
+    from a _SpanIndex, and those starting below its top from a sorted list of
+    top edges. Each rectangle is only compared with the active ones that also
+    overlap it vertically, so slides with many shapes side by side or stacked
+    cost O(n log n + k) for k candidate pairs instead of comparing all n²
+    pairs. Every candidate is confirmed with calculate_overlap, so the results
+    are identical to a pairwise comparison.
+
+    Args:
+        rects: (left, top, width, height) of each rectangle in inches
+        tolerance: Minimum overlap in inches to consider as overlapping
+
+    Returns:
+        List of (i, j, overlap_area) with i < j, sorted by (i, j)
+    """
+    order = sorted(range(len(rects)), key=lambda index: rects[index][0])
+    active: List[Tuple[float, int]] = []  # (right edge, index) heap
+    spans = _SpanIndex([y for _, top, _, h in rects for y in (top, top + h)])
+    tops: List[Tuple[float, int]] = []  # (top edge, index) of active, sorted
+    pairs = []
+
+    for j in order:
+        left, top, width, height = rects[j]
+        # Rectangles ending before this left edge can't overlap it or any later one
+        while active and active[0][0] - left <= tolerance:
+            _, i = heapq.heappop(active)
+            spans.remove(i)
+            del tops[bisect.bisect_left(tops, (rects[i][1], i))]
+
+        # Candidates end below low and start above high; the bounds are
+        # widened slightly so rounding never hides a pair calculate_overlap
+        # would accept
+        low = top + tolerance - OVERLAP_EPSILON
+        high = top + height - tolerance + OVERLAP_EPSILON
+        candidates = spans.containing(low)
+        position = bisect.bisect_right(tops, (low, len(rects)))
+        while position < len(tops) and tops[position][0] < high:
+            candidates.append(tops[position][1])
+            position += 1
+
+        for i in candidates:
+            overlaps, overlap_area = calculate_overlap(rects[i], rects[j], tolerance)
+            if overlaps:
+                pairs.append((i, j, overlap_area) if i < j else (j, i, overlap_area))
+
+        heapq.heappush(active, (left + width, j))
+        spans.add(j, top, top + height)
+        bisect.insort(tops, (top, j))
+
+    pairs.sort()
+    return pairs
+
+
+class _SpanIndex:
+    """Set of half-open spans [low, high) that can list those containing a point.
+
+    A segment tree over the span ends given up front: each span is stored in
+    the O(log n) nodes that exactly cover it, so adding or removing a span
+    and listing the spans that contain a point take O(log n) plus the number
+    of spans listed.
+    """
+
+    def __init__(self, coordinates: List[float]):
+        self.coordinates = sorted(set(coordinates))
+        # Leaf k is the elementary span [coordinates[k], coordinates[k + 1])
+        self.leaves = len(self.coordinates) - 1
+        self.nodes: List[set] = [set() for _ in range(4 * max(self.leaves, 1))]
+        self.spans: Dict[int, Tuple[int, int]] = {}
+
+    def add(self, key: int, low: float, high: float) -> None:
+        first = bisect.bisect_left(self.coordinates, low)
+        last = bisect.bisect_left(self.coordinates, high) - 1
+        if first <= last:
+            self.spans[key] = (first, last)
+            self._update(1, 0, self.leaves - 1, first, last, key, True)
+
+    def remove(self, key: int) -> None:
+        if key in self.spans:
+            first, last = self.spans.pop(key)
+            self._update(1, 0, self.leaves - 1, first, last, key, False)
+
+    def containing(self, point: float) -> List[int]:
+        """Keys of the spans with low <= point < high."""
+        leaf = bisect.bisect_right(self.coordinates, point) - 1
+        found: List[int] = []
+        if not 0 <= leaf < self.leaves:
+            return found
+        node, lo, hi = 1, 0, self.leaves - 1
+        while True:
+            found.extend(self.nodes[node])
+            if lo == hi:
+                return found
+            mid = (lo + hi) // 2
+            if leaf <= mid:
+                node, hi = 2 * node, mid
+            else:
+                node, lo = 2 * node + 1, mid + 1
+
+    def _update(
+        self, node: int, lo: int, hi: int, first: int, last: int, key: int, add: bool
+    ) -> None:
+        if last < lo or hi < first:
+            return
+        if first <= lo and hi <= last:
+            if add:
+                self.nodes[node].add(key)
+            else:
+                self.nodes[node].discard(key)
+            return
+        mid = (lo + hi) // 2
+        self._update(2 * node, lo, mid, first, last, key, add)
+        self._update(2 * node + 1, mid + 1, hi, first, last, key, add)
+
+
 def detect_overlaps(shapes: List[ShapeData]) -> None:
     """Detect overlapping shapes and update their overlapping_shapes dictionaries.
 
@@ -888,31 +1632,33 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
-
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    if len(shapes) < 2:
+        return
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+    # Ensure shape IDs are set
+    for index, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {index} has no shape_id"
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+    rects = [(s.left, s.top, s.width, s.height) for s in shapes]
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    # Pairs come back in (i, j) order, so the dictionaries are filled in the
+    # same order as comparing each pair in turn
+    for i, j, overlap_area in find_overlapping_pairs(rects):
+        shape1 = shapes[i]
+        shape2 = shapes[j]
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+        # Add shape IDs with overlap area in square inches
+        shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+        shape2.overlapping_shapes[shape1.shape_id] = overlap_area
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
+    cache: bool = False,
+    read_only: bool = False,
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,58 +1666,724 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes. With more than one, slides are
+            measured in workers that each load pptx_path once, so prs must
+            match the file on disk.
+        cache: If True, reuse and update the InventoryCache next to pptx_path,
+            so only slides whose content changed are measured
+        read_only: If True, read the package XML directly with PackageReader
+            instead of loading it with python-pptx. This is much faster and
+            gives the same inventory, but prs is ignored and the ShapeData
+            have no shape to edit.
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
     The ShapeData objects contain the full shape information and can be
     converted to dictionaries for JSON serialization using to_dict().
     """
-    if prs is None:
-        prs = Presentation(str(pptx_path))
-    inventory: InventoryData = {}
+    return dict(
+        iter_text_inventory(pptx_path, prs, issues_only, jobs, cache, read_only)
+    )
 
-    for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
 
-        if not shapes_with_positions:
-            continue
+def iter_text_inventory(
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
+    cache: bool = False,
+    read_only: bool = False,
+) -> Iterator[Tuple[str, Dict[str, ShapeData]]]:
+    """Yield the inventory one slide at a time, as (slide-N, {shape-N: ShapeData}).
+
+    Takes the same arguments as extract_text_inventory and yields its items
+    in order, but each slide is measured only when it is requested. Together
+    with InventoryWriter this keeps the memory used on large decks to about
+    one slide's worth of ShapeData. The cache is saved once every slide has
+    been yielded.
+    """
+    reader: Union[PackageReader, PresentationReader]
+    if read_only:
+        reader = PackageReader(pptx_path)
+    else:
+        reader = PresentationReader(prs or Presentation(str(pptx_path)))
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
+    pool_results: Optional[Iterator[List[Tuple[int, tuple]]]] = None
+    try:
+        # Unchanged slides are served from the cache, only their records are kept
+        inventory_cache = InventoryCache.for_deck(Path(pptx_path)) if cache else None
+        keys: List[str] = []
+        cached: Dict[int, List] = {}
+        if inventory_cache:
+            keys = [
+                inventory_cache.slide_key(reader.part_digests(idx), reader.slide_size)
+                for idx in range(reader.slide_count)
+            ]
+            for slide_idx, key in enumerate(keys):
+                records = inventory_cache.get(key)
+                if records is not None:
+                    cached[slide_idx] = records
+
+        missing = [idx for idx in range(reader.slide_count) if idx not in cached]
+        if jobs > 1 and len(missing) >= MIN_PARALLEL_SLIDES:
+            pool_results = _inventory_slides_in_pool(
+                pptx_path, missing, jobs, read_only
             )
-            for swp in shapes_with_positions
+
+        for slide_idx in range(reader.slide_count):
+            if slide_idx in cached:
+                sorted_shapes = reader.rebuild_slide(slide_idx, cached.pop(slide_idx))
+            elif pool_results is not None:
+                records = next(pool_results)
+                sorted_shapes = reader.rebuild_slide(slide_idx, records)
+                if inventory_cache:
+                    inventory_cache.put(keys[slide_idx], records)
+            elif inventory_cache:
+                sorted_shapes, records = reader.read_slide_records(slide_idx)
+                inventory_cache.put(keys[slide_idx], records)
+            else:
+                sorted_shapes = reader.read_slide(slide_idx)
+
+            # Filter for issues only if requested (after overlap detection)
+            if issues_only:
+                sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+            if not sorted_shapes:
+                continue
+
+            # Create slide inventory using the stable shape IDs
+            yield (
+                f"slide-{slide_idx}",
+                {shape_data.shape_id: shape_data for shape_data in sorted_shapes},
+            )
+    finally:
+        if pool_results is not None:
+            pool_results.close()
+        # Text bodies requested after this reopen the package for the read
+        reader.close()
+
+    if inventory_cache:
+        inventory_cache.save()
+
+
+def collect_slide_shapes(slide: Any) -> List[ShapeWithPosition]:
+    """Collect the text shapes of a slide with absolute positions, in tree order."""
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+    return shapes_with_positions
+
+
+def inventory_slide(
+    slide: Any, styles: Optional[StyleResolver] = None
+) -> List[ShapeData]:
+    """Build the ShapeData of one slide, sorted, with IDs and overlaps set."""
+    return _sort_slide_shapes(_build_slide_shapes(slide, styles))
+
+
+def _build_slide_shapes(
+    slide: Any, styles: Optional[StyleResolver] = None
+) -> List[ShapeData]:
+    """Convert to ShapeData with absolute positions and slide reference."""
+    styles = styles or StyleResolver()
+    return [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            styles,
+        )
+        for swp in collect_slide_shapes(slide)
+    ]
+
+
+def _sort_slide_shapes(shape_data_list: List[ShapeData]) -> List[ShapeData]:
+    """Sort a slide's shapes, assign their IDs and detect overlaps."""
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    return sorted_shapes
+
+
+def _rebuild_slide_shapes(slide: Any, records: List) -> List[ShapeData]:
+    """Rebuild a slide's sorted ShapeData from (shape index, record) pairs."""
+    locate = _shape_locator(slide)
+    return [
+        ShapeData.from_record(record, functools.partial(locate, index))
+        for index, record in records
+    ]
+
+
+def _shape_locator(slide: Any) -> Callable[[int], BaseShape]:
+    """Return a function mapping collect_slide_shapes positions to shapes."""
+    shapes: List[BaseShape] = []
+
+    def locate(index: int) -> BaseShape:
+        if not shapes:
+            shapes.extend(swp.shape for swp in collect_slide_shapes(slide))
+        return shapes[index]
+
+    return locate
+
+
+def _slide_records(
+    shape_data_list: List[ShapeData],
+) -> Tuple[List[ShapeData], List[Tuple[int, tuple]]]:
+    """Sort a slide's shapes, also returning (shape index, record) pairs.
+
+    The shape index is the shape's position in the unsorted list (tree
+    order), which is used to find the shape again when rebuilding a record.
+    """
+    positions = {id(sd): index for index, sd in enumerate(shape_data_list)}
+    sorted_shapes = _sort_slide_shapes(shape_data_list)
+    return sorted_shapes, [(positions[id(sd)], sd.to_record()) for sd in sorted_shapes]
+
+
+class PresentationReader:
+    """Slides of a python-pptx Presentation, read through python-pptx.
+
+    ShapeData built by this reader keep their PowerPoint shapes, which
+    replace.py needs to edit the text. Has the same interface as
+    PackageReader.
+    """
+
+    def __init__(self, prs: Any):
+        self.slides = list(prs.slides)
+        self.slide_size = (prs.slide_width, prs.slide_height)
+        self.styles = StyleResolver()
+        self._digests: Dict[Any, str] = {}
+
+    @property
+    def slide_count(self) -> int:
+        return len(self.slides)
+
+    def part_digests(self, slide_idx: int) -> List[str]:
+        """Hash the XML of a slide's part, layout and master."""
+        slide = self.slides[slide_idx]
+        layout = slide.slide_layout
+        digests = []
+        for part in (slide.part, layout.part, layout.slide_master.part):
+            if part not in self._digests:
+                self._digests[part] = hashlib.sha256(part.blob).hexdigest()
+            digests.append(self._digests[part])
+        return digests
+
+    def read_slide(self, slide_idx: int) -> List[ShapeData]:
+        """Build the sorted ShapeData of a slide."""
+        return inventory_slide(self.slides[slide_idx], self.styles)
+
+    def read_slide_records(
+        self, slide_idx: int
+    ) -> Tuple[List[ShapeData], List[Tuple[int, tuple]]]:
+        """Build the sorted ShapeData of a slide and their records."""
+        return _slide_records(_build_slide_shapes(self.slides[slide_idx], self.styles))
+
+    def rebuild_slide(self, slide_idx: int, records: List) -> List[ShapeData]:
+        """Rebuild a slide's sorted ShapeData from cached records."""
+        return _rebuild_slide_shapes(self.slides[slide_idx], records)
+
+    def close(self) -> None:
+        """Nothing to release; the Presentation belongs to the caller."""
+
+
+class PackageReader:
+    """Read-only view of a .pptx package, parsed directly with lxml.
+
+    The presentation, slide, layout and master parts are read straight from
+    the zip file, without building python-pptx's object graph. Placeholder
+    inheritance is resolved the way python-pptx does it: a slide placeholder
+    takes missing position and size values from the layout placeholder with
+    the same idx, which in turn takes them from the master placeholder of
+    its base type. Nothing is ever written, and the output is the same as
+    PresentationReader's, except that ShapeData.shape is None.
+
+    Layouts and masters are parsed up front, slides only when they are read,
+    so a reader holds one slide's XML at a time. The zip file stays open
+    until close() is called (or the reader is used as a context manager).
+    Rebuilt ShapeData read their text bodies on demand, so a text body
+    requested after close() reopens the file just for that read.
+    """
+
+    # Master placeholder type that each layout placeholder type inherits from
+    BASE_PLACEHOLDER_TYPES = {
+        ph_type.xml_value: base_type.xml_value
+        for ph_type, base_type in (
+            (PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.BITMAP, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.CENTER_TITLE, PP_PLACEHOLDER.TITLE),
+            (PP_PLACEHOLDER.ORG_CHART, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.DATE, PP_PLACEHOLDER.DATE),
+            (PP_PLACEHOLDER.FOOTER, PP_PLACEHOLDER.FOOTER),
+            (PP_PLACEHOLDER.MEDIA_CLIP, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.OBJECT, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.PICTURE, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.SLIDE_NUMBER, PP_PLACEHOLDER.SLIDE_NUMBER),
+            (PP_PLACEHOLDER.SUBTITLE, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.TABLE, PP_PLACEHOLDER.BODY),
+            (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.TITLE),
+        )
+    }
+
+    # Same settings as python-pptx's parser, so parts serialize identically
+    _parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+    def __init__(self, pptx_path: Path):
+        self._parts: Dict[str, Any] = {}
+        self._digests: Dict[str, str] = {}
+        # Slide index -> (slide, layout, master) part names
+        self.slides: List[Tuple[str, str, str]] = []
+        # Most recently parsed slide: (slide index, root element)
+        self._slide: Tuple[Optional[int], Any] = (None, None)
+
+        self.pptx_path = pptx_path
+        self._package: Optional[zipfile.ZipFile] = zipfile.ZipFile(pptx_path)
+        try:
+            presentation_name = self._related("", RT.OFFICE_DOCUMENT)[0]
+            presentation = self._load(presentation_name)
+            slide_names = self._relationships(presentation_name)
+
+            sldSz = presentation.find(qn("p:sldSz"))
+            self.slide_size: Tuple[Optional[int], Optional[int]] = (
+                (int(sldSz.get("cx")), int(sldSz.get("cy")))
+                if sldSz is not None
+                else (None, None)
+            )
+
+            # Layouts and masters are shared between slides and parsed once;
+            # slides are parsed when they are read
+            sldIdLst = presentation.find(qn("p:sldIdLst"))
+            for sldId in sldIdLst if sldIdLst is not None else ():
+                slide_name = slide_names[sldId.get(qn("r:id"))][1]
+                layout_name = self._related(slide_name, RT.SLIDE_LAYOUT)[0]
+                master_name = self._related(layout_name, RT.SLIDE_MASTER)[0]
+                self._load(layout_name)
+                self._load(master_name)
+                self.slides.append((slide_name, layout_name, master_name))
+        except BaseException:
+            self._package.close()
+            raise
+
+        # Part name -> placeholder elements by idx (layouts) or type (masters)
+        self._layout_placeholders: Dict[str, Dict[int, Any]] = {}
+        self._master_placeholders: Dict[str, Dict[str, Any]] = {}
+        self.styles = StyleResolver()
+
+    @property
+    def slide_count(self) -> int:
+        return len(self.slides)
+
+    def part_digests(self, slide_idx: int) -> List[str]:
+        """Hash the XML of a slide's part, layout and master.
+
+        Parts are hashed as python-pptx serializes them, so the digests (and
+        cache keys) are the same for both readers.
+        """
+        slide_name, layout_name, master_name = self.slides[slide_idx]
+        digests = []
+        for name, root in (
+            (slide_name, None),
+            (layout_name, self._parts[layout_name]),
+            (master_name, self._parts[master_name]),
+        ):
+            if name not in self._digests:
+                xml = etree.tostring(
+                    root if root is not None else self._slide_root(slide_idx),
+                    encoding="UTF-8",
+                    standalone=True,
+                )
+                self._digests[name] = hashlib.sha256(xml).hexdigest()
+            digests.append(self._digests[name])
+        return digests
+
+    def read_slide(self, slide_idx: int) -> List[ShapeData]:
+        """Build the sorted ShapeData of a slide."""
+        return _sort_slide_shapes(self._build_slide_shapes(slide_idx))
+
+    def read_slide_records(
+        self, slide_idx: int
+    ) -> Tuple[List[ShapeData], List[Tuple[int, tuple]]]:
+        """Build the sorted ShapeData of a slide and their records."""
+        return _slide_records(self._build_slide_shapes(slide_idx))
+
+    def rebuild_slide(self, slide_idx: int, records: List) -> List[ShapeData]:
+        """Rebuild a slide's sorted ShapeData from cached records."""
+        text_bodies: List[Any] = []
+
+        def locate(index: int) -> Any:
+            if not text_bodies:
+                text_bodies.extend(
+                    element.find(_P_TXBODY)
+                    for element, _, _ in self._collect_slide_shapes(slide_idx)
+                )
+            return text_bodies[index]
+
+        return [
+            ShapeData.from_record(
+                record, locate_text_body=functools.partial(locate, index)
+            )
+            for index, record in records
         ]
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+    def close(self) -> None:
+        """Close the zip file; later part reads reopen it for the read."""
+        if self._package is not None:
+            self._package.close()
+            self._package = None
+
+    def __enter__(self) -> "PackageReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _read(self, name: str) -> bytes:
+        """Return the bytes of a zip member, reopening the file if closed."""
+        if self._package is not None:
+            return self._package.read(name)
+        with zipfile.ZipFile(self.pptx_path) as package:
+            return package.read(name)
+
+    def _build_slide_shapes(self, slide_idx: int) -> List[ShapeData]:
+        """Convert a slide's text shapes to ShapeData, in tree order."""
+        _, layout_name, master_name = self.slides[slide_idx]
+        layout = self._parts[layout_name]
+        master = self._parts[master_name]
+
+        shape_data_list = []
+        for element, geometry, ph in self._collect_slide_shapes(slide_idx):
+            placeholder_type = default_font_size = None
+            if ph is not None:
+                ph_type = ph.get("type", "obj")
+                placeholder_type = PP_PLACEHOLDER.from_xml(ph_type).name
+                default_font_size = self.styles.layout_font_size(layout, ph_type)
+            shape_data_list.append(
+                ShapeData.from_xml(
+                    element.find(_P_TXBODY),
+                    master,
+                    geometry,
+                    self.slide_size,
+                    placeholder_type,
+                    default_font_size,
+                    self.styles,
+                )
+            )
+        return shape_data_list
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+    def _collect_slide_shapes(
+        self, slide_idx: int
+    ) -> List[Tuple[Any, Tuple[int, int, int, int], Any]]:
+        """Collect a slide's text shapes as (element, geometry, p:ph), in tree order.
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+        Geometry is the absolute (left, top, width, height) in EMUs, with
+        placeholder values inherited from the layout and master.
+        """
+        slide_name, layout_name, master_name = self.slides[slide_idx]
+        spTree = self._slide_root(slide_idx).find(f"{qn('p:cSld')}/{qn('p:spTree')}")
+        result: List[Tuple[Any, Tuple[int, int, int, int], Any]] = []
+        if spTree is None:
+            return result
+
+        def collect(parent: Any, parent_left: int, parent_top: int) -> None:
+            for element in parent:
+                if element.tag not in SHAPE_TAGS:
+                    continue
+                left, top, width, height = self._transform(element)
+                if element.tag == _P_GRPSP:
+                    # Children are positioned relative to the group
+                    collect(element, parent_left + (left or 0), parent_top + (top or 0))
+                    continue
+                if element.tag != _P_SP:
+                    continue
+                txBody = element.find(_P_TXBODY)
+                if txBody is None:
+                    continue
+
+                ph = placeholder_element(element)
+                placeholder_type = None
+                if ph is not None:
+                    placeholder_type = PP_PLACEHOLDER.from_xml(
+                        ph.get("type", "obj")
+                    ).name
+                if not is_content_text(
+                    text_body_text(txBody).strip(), placeholder_type
+                ):
+                    continue
+
+                # Only slide-level placeholders inherit, group children never do
+                if ph is not None and parent is spTree:
+                    inherited = self._inherited_transform(layout_name, master_name, ph)
+                    left, top, width, height = (
+                        own if own is not None else base
+                        for own, base in zip((left, top, width, height), inherited)
+                    )
+                result.append(
+                    (
+                        element,
+                        (
+                            parent_left + (left or 0),
+                            parent_top + (top or 0),
+                            width or 0,
+                            height or 0,
+                        ),
+                        ph,
+                    )
+                )
 
-        if not sorted_shapes:
-            continue
+        collect(spTree, 0, 0)
+        return result
+
+    def _inherited_transform(
+        self, layout_name: str, master_name: str, ph: Any
+    ) -> List[Optional[int]]:
+        """Return the (x, y, cx, cy) a slide placeholder inherits from its layout."""
+        layout_element = self._placeholders_by_idx(layout_name).get(
+            int(ph.get("idx", "0"))
+        )
+        if layout_element is None:
+            return [None] * 4
+        values = self._transform(layout_element)
+
+        # Layout placeholders inherit from the master placeholder of their base type
+        if None in values and layout_element.tag == _P_SP:
+            layout_type = placeholder_element(layout_element).get("type", "obj")
+            base_type = self.BASE_PLACEHOLDER_TYPES.get(layout_type)
+            master_element = self._placeholders_by_type(master_name).get(base_type)
+            if master_element is not None:
+                values = [
+                    own if own is not None else base
+                    for own, base in zip(values, self._transform(master_element))
+                ]
+        return values
+
+    def _placeholders_by_idx(self, layout_name: str) -> Dict[int, Any]:
+        """Map each idx to the first placeholder of a layout with that idx."""
+        if layout_name not in self._layout_placeholders:
+            placeholders: Dict[int, Any] = {}
+            for element, ph in iter_placeholders(self._parts[layout_name]):
+                placeholders.setdefault(int(ph.get("idx", "0")), element)
+            self._layout_placeholders[layout_name] = placeholders
+        return self._layout_placeholders[layout_name]
+
+    def _placeholders_by_type(self, master_name: str) -> Dict[str, Any]:
+        """Map each type to the first placeholder shape of a master with that type."""
+        if master_name not in self._master_placeholders:
+            placeholders: Dict[str, Any] = {}
+            for element, ph in iter_placeholders(self._parts[master_name]):
+                if element.tag == _P_SP:
+                    placeholders.setdefault(ph.get("type", "obj"), element)
+            self._master_placeholders[master_name] = placeholders
+        return self._master_placeholders[master_name]
+
+    @staticmethod
+    def _transform(element: Any) -> List[Optional[int]]:
+        """Return a shape element's own (x, y, cx, cy), None where not set."""
+        if element.tag == _P_GRPSP:
+            xfrm = element.find(f"{qn('p:grpSpPr')}/{qn('a:xfrm')}")
+        elif element.tag == qn("p:graphicFrame"):
+            xfrm = element.find(qn("p:xfrm"))
+        else:
+            xfrm = element.find(f"{qn('p:spPr')}/{qn('a:xfrm')}")
+
+        values: List[Optional[int]] = [None] * 4
+        if xfrm is not None:
+            off = xfrm.find(qn("a:off"))
+            if off is not None:
+                values[0] = ST_Coordinate.from_xml(off.get("x"))
+                values[1] = ST_Coordinate.from_xml(off.get("y"))
+            ext = xfrm.find(qn("a:ext"))
+            if ext is not None:
+                values[2] = ST_PositiveCoordinate.from_xml(ext.get("cx"))
+                values[3] = ST_PositiveCoordinate.from_xml(ext.get("cy"))
+        return values
+
+    def _slide_root(self, slide_idx: int) -> Any:
+        """Parse a slide part, keeping only the most recently parsed slide.
+
+        Shapes read from a slide keep their own references to its elements,
+        so the inventory holds on to a slide only as long as its ShapeData.
+        """
+        if self._slide[0] != slide_idx:
+            xml = self._read(self.slides[slide_idx][0])
+            self._slide = (slide_idx, etree.fromstring(xml, self._parser))
+        return self._slide[1]
+
+    def _load(self, name: str) -> Any:
+        """Parse a part once, returning its root element."""
+        if name not in self._parts:
+            self._parts[name] = etree.fromstring(self._read(name), self._parser)
+        return self._parts[name]
+
+    def _related(self, name: str, reltype: str) -> List[str]:
+        """Return the names of the parts related to a part by reltype, in order."""
+        related = [
+            target
+            for rel_type, target in self._relationships(name).values()
+            if rel_type == reltype
+        ]
+        if not related:
+            raise KeyError(f"no relationship of type '{reltype}' in '{name or '/'}'")
+        return related
+
+    def _relationships(self, name: str) -> Dict[str, Tuple[str, str]]:
+        """Return rId -> (relationship type, target part name) for a part."""
+        directory, filename = posixpath.split(name)
+        try:
+            rels = etree.fromstring(
+                self._read(posixpath.join(directory, "_rels", f"{filename}.rels")),
+                self._parser,
+            )
+        except KeyError:
+            return {}
+
+        relationships = {}
+        for rel in rels:
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(directory, target))
+            relationships[rel.get("Id")] = (rel.get("Type"), target)
+        return relationships
+
+
+# Minimum slide count before extraction is spread over worker processes
+MIN_PARALLEL_SLIDES = 8
+
+# Reader loaded once by each inventory worker process
+_worker_reader: Optional[Union["PackageReader", "PresentationReader"]] = None
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
 
-    return inventory
+def _inventory_slides_in_pool(
+    pptx_path: Path, slide_indices: List[int], jobs: int, read_only: bool = False
+) -> Iterator[List[Tuple[int, tuple]]]:
+    """Inventory slides in worker processes, yielding their records in order.
+
+    Workers run ahead of the consumer; closing the generator early shuts the
+    pool down.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path), read_only),
+    ) as executor:
+        chunksize = max(1, len(slide_indices) // (jobs * 4))
+        yield from executor.map(
+            _inventory_worker_slide, slide_indices, chunksize=chunksize
+        )
+
+
+def _init_inventory_worker(pptx_path: str, read_only: bool) -> None:
+    """Load the presentation once per worker process."""
+    global _worker_reader
+    if read_only:
+        _worker_reader = PackageReader(Path(pptx_path))
+    else:
+        _worker_reader = PresentationReader(Presentation(pptx_path))
+
+
+def _inventory_worker_slide(slide_idx: int) -> List[Tuple[int, tuple]]:
+    """Inventory one slide in a worker, returning (shape index, record) pairs."""
+    return _worker_reader.read_slide_records(slide_idx)[1]  # type: ignore
+
+
+class InventoryCache:
+    """Inventory records of a deck's slides, keyed by content hash.
+
+    The cache is a JSON file stored next to the deck. A slide's key hashes
+    its slide part together with its layout and master parts and the slide
+    size, so an edit only invalidates the slides that depend on the edited
+    part, and moving slides around keeps them cached. Records are the
+    compact (shape index, ShapeData.to_record) pairs used by worker
+    processes. The whole cache is dropped when the installed fonts change.
+    """
+
+    # Bump when records or measurement change
+    VERSION = 1
+
+    @classmethod
+    def for_deck(cls, pptx_path: Path) -> "InventoryCache":
+        """Return the cache for a deck, stored as .<name>.inventory-cache."""
+        return cls(pptx_path.with_name(f".{pptx_path.name}.inventory-cache"))
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self.environment = self._environment()
+        # Slide key -> [(shape index, record)]
+        self.slides: Dict[str, List] = {}
+        self._used: set = set()
+        self._changed = False
+        self._load()
+
+    def slide_key(
+        self, part_digests: List[str], slide_size: Tuple[Optional[int], Optional[int]]
+    ) -> str:
+        """Hash a slide's part, layout and master digests and the slide size."""
+        digest = hashlib.sha256()
+        for part_digest in part_digests:
+            digest.update(part_digest.encode("ascii"))
+        digest.update(f"{slide_size[0]}x{slide_size[1]}".encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List]:
+        """Return the records for a slide key, or None if not cached."""
+        records = self.slides.get(key)
+        if records is not None:
+            self._used.add(key)
+        return records
+
+    def put(self, key: str, records: List) -> None:
+        """Store the records for a slide key."""
+        self.slides[key] = records
+        self._used.add(key)
+        self._changed = True
+
+    def save(self) -> None:
+        """Write the cache, dropping slides that were not looked up this run."""
+        if not self._changed and self._used == set(self.slides):
+            return
+        data = {
+            "version": self.VERSION,
+            "environment": self.environment,
+            "slides": {key: self.slides[key] for key in self._used},
+        }
+        try:
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass  # The inventory is still correct, it just is not cached
+
+    def _environment(self) -> str:
+        """Identify the inputs shared by all slides: cache layout and fonts."""
+        font_index = get_font_index()
+        return hashlib.sha256(
+            json.dumps(
+                [self.VERSION, font_index.VERSION, font_index.dir_mtimes],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if (
+                data.get("version") != self.VERSION
+                or data.get("environment") != self.environment
+            ):
+                return
+            self.slides = data["slides"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.slides = {}
 
 
 def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
@@ -988,7 +2400,9 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
+    inventory = extract_text_inventory(
+        pptx_path, issues_only=issues_only, read_only=True
+    )
 
     # Convert ShapeData objects to dictionaries
     dict_inventory: InventoryDict = {}
@@ -1000,20 +2414,69 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     return dict_inventory
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
-    """Save inventory to JSON file with proper formatting.
+class InventoryWriter:
+    """Write an inventory to a file one slide at a time.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    By default the file is the same JSON document json.dump would write for
+    the whole inventory, but each slide is serialized and written as soon as
+    it is added, so only one slide is ever held as dictionaries. With ndjson,
+    each line is instead a self-contained {"slide": ..., "shapes": ...}
+    object, which can be read back slide by slide as well.
+
+    Usage:
+        with InventoryWriter(output_path) as writer:
+            for slide_key, shapes in iter_text_inventory(pptx_path):
+                writer.write_slide(slide_key, shapes)
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
+
+    def __init__(self, output_path: Path, ndjson: bool = False):
+        self.output_path = output_path
+        self.ndjson = ndjson
+        self.slide_count = 0
+        self._file: Optional[Any] = None
+
+    def __enter__(self) -> "InventoryWriter":
+        self._file = open(self.output_path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._file is None:
+            return
+        if not self.ndjson:
+            self._file.write("\n}" if self.slide_count else "{}")
+        self._file.close()
+        self._file = None
+
+    def write_slide(self, slide_key: str, shapes: Dict[str, ShapeData]) -> None:
+        """Serialize one slide's shapes and append them to the file."""
+        assert self._file is not None, "InventoryWriter must be used as a context"
+        shape_dicts = {
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        if self.ndjson:
+            record = {"slide": slide_key, "shapes": shape_dicts}
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            # Indent the slide one level, as it is nested in the top-level object
+            body = json.dumps(shape_dicts, indent=2, ensure_ascii=False)
+            key = json.dumps(slide_key, ensure_ascii=False)
+            self._file.write("{\n  " if not self.slide_count else ",\n  ")
+            self._file.write(f"{key}: " + body.replace("\n", "\n  "))
+        self.slide_count += 1
+
+
+def save_inventory(
+    inventory: InventoryData, output_path: Path, ndjson: bool = False
+) -> None:
+    """Save inventory to JSON file with proper formatting.
+
+    Converts ShapeData objects to dictionaries for JSON serialization.
+    With ndjson, writes one JSON object per slide and line instead.
+    """
+    with InventoryWriter(output_path, ndjson=ndjson) as writer:
+        for slide_key, shapes in inventory.items():
+            writer.write_slide(slide_key, shapes)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,13 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-from inventory import InventoryData, extract_text_inventory
+from inventory import (
+    InventoryData,
+    ShapeData,
+    StyleResolver,
+    extract_text_inventory,
+    is_valid_shape,
+)
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -159,6 +165,43 @@ def detect_frame_overflow(inventory: InventoryData) -> Dict[str, Dict[str, float
     return overflow_map
 
 
+def measure_replaced_shapes(
+    prs: Any, inventory: InventoryData, replaced: Dict[str, List[str]]
+) -> InventoryData:
+    """Re-measure the shapes that received replacement text.
+
+    ShapeData reads the XML without modifying it, so the edited presentation
+    is measured in place. Shapes keep their inventory keys and positions, and
+    shapes left without text are skipped like in a fresh inventory.
+
+    Returns an inventory of slide_key -> shape_key -> updated ShapeData.
+    """
+    updated_inventory: InventoryData = {}
+    styles = StyleResolver()
+
+    for slide_key, shape_keys in replaced.items():
+        slide = prs.slides[int(slide_key.split("-")[1])]
+        updated_shapes = []
+        for shape_key in shape_keys:
+            shape_data = inventory[slide_key][shape_key]
+            if not is_valid_shape(shape_data.shape):
+                continue
+            updated = ShapeData(
+                shape_data.shape,
+                shape_data.left_emu,
+                shape_data.top_emu,
+                slide,
+                styles,
+            )
+            updated.shape_id = shape_key
+            updated_shapes.append(updated)
+
+        if updated_shapes:
+            updated_inventory[slide_key] = {sd.shape_id: sd for sd in updated_shapes}
+
+    return updated_inventory
+
+
 def validate_replacements(inventory: InventoryData, replacements: Dict) -> List[str]:
     """Validate that all shapes in replacements exist in inventory.
 
@@ -218,8 +261,8 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     prs = Presentation(pptx_file)
 
     # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
+    # Pass prs to use same Presentation instance; unchanged slides come from the cache
+    inventory = extract_text_inventory(Path(pptx_file), prs, cache=True)
 
     # Detect text overflow in original presentation
     original_overflow = detect_frame_overflow(inventory)
@@ -244,6 +287,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     shapes_processed = 0
     shapes_cleared = 0
     shapes_replaced = 0
+    replaced: Dict[str, List[str]] = {}
 
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
@@ -278,6 +322,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
                 continue
 
             shapes_replaced += 1
+            replaced.setdefault(slide_key, []).append(shape_key)
 
             # Add replacement paragraphs
             for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
@@ -288,20 +333,10 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
-
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+    # Check for issues after replacements (cleared shapes have no text left,
+    # so only the replaced shapes need to be measured again)
+    updated_inventory = measure_replaced_shapes(prs, inventory, replaced)
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -38,6 +38,7 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+    # (placeholders that overlap another text shape are outlined in orange)
 """
 
 import argparse
@@ -46,7 +47,11 @@ import sys
 import tempfile
 from pathlib import Path
 
+# The ooxml package sits next to this scripts directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from inventory import extract_text_inventory
+from ooxml.scripts.pack import convert_document
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 
@@ -63,6 +68,10 @@ BORDER_WIDTH = 2  # Border width around thumbnails
 FONT_SIZE_RATIO = 0.12  # Font size as fraction of thumbnail width
 LABEL_PADDING_RATIO = 0.4  # Label padding as fraction of font size
 
+# Placeholder outline colors
+OUTLINE_COLOR = (255, 0, 0, 255)  # Bright red, fully opaque
+OVERLAP_OUTLINE_COLOR = (255, 140, 0, 255)  # Orange for overlapping text shapes
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -161,11 +170,12 @@ def get_placeholder_regions(pptx_path):
 
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
-    Each region is a dict with 'left', 'top', 'width', 'height' in inches.
+    Each region is a dict with 'left', 'top', 'width', 'height' in inches and
+    'overlapping', which is True if the region overlaps another text region.
     slide_dimensions is a tuple of (width_inches, height_inches).
     """
     prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
+    inventory = extract_text_inventory(pptx_path, cache=True, read_only=True)
     placeholder_regions = {}
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
@@ -185,6 +195,7 @@ def get_placeholder_regions(pptx_path):
                     "top": shape_data.top,
                     "width": shape_data.width,
                     "height": shape_data.height,
+                    "overlapping": bool(shape_data.overlapping_shapes),
                 }
             )
 
@@ -212,25 +223,12 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
+    # Convert to PDF (on a warm LibreOffice instance when the pool is available)
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    try:
+        pdf_path = convert_document(pptx_path, "pdf", temp_dir)
+    except (FileNotFoundError, RuntimeError) as e:
+        raise RuntimeError("PDF conversion failed") from e
 
     # Convert PDF to images
     print(f"Converting to images at {dpi} DPI...")
@@ -417,7 +415,9 @@ def create_grid(
                     )  # Thicker proportional stroke width
                     overlay_draw.rectangle(
                         [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
+                        outline=OVERLAP_OUTLINE_COLOR
+                        if region.get("overlapping")
+                        else OUTLINE_COLOR,
                         width=stroke_width,
                     )
 